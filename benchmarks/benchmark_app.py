@@ -0,0 +1,234 @@
+"""Benchmark headless de app.py con el framework de pruebas de Streamlit (AppTest).
+
+Selecciona cada sección de la barra lateral, simula las interacciones que
+tiene (botones, sliders, formulario de registro, cargas de CSV sintéticos de
+tamaño creciente...) y guarda en un JSON los percentiles de latencia de cada
+rerun y el pico de memoria de cada escenario.
+
+Uso:
+    python benchmarks/benchmark_app.py --repeticiones 20 --salida bench.json
+"""
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+
+
+# CSV sintético con columnas típicas de un extracto de ventas
+def csv_sintetico(filas, semilla=0):
+    rng = np.random.default_rng(semilla)
+    df = pd.DataFrame({
+        "id": np.arange(filas),
+        "Región": rng.choice(["Norte", "Sur", "Este", "Oeste", "Centro"], filas),
+        "Producto": rng.choice(list("ABCDEFGHIJ"), filas),
+        "Ventas": rng.gamma(2.0, 100.0, filas).round(2),
+        "Fecha": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, filas), unit="D"),
+    })
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue().encode()
+
+
+def _por_etiqueta(elementos, etiqueta):
+    for elemento in elementos:
+        if elemento.label == etiqueta:
+            return elemento
+    raise LookupError(f"No se encontró el widget {etiqueta!r}")
+
+
+def _clic(etiqueta):
+    return lambda at: _por_etiqueta(at.button, etiqueta).click().run()
+
+
+def _formulario(at):
+    _por_etiqueta(at.text_input, "Nombre completo: *").input("Ana Pérez")
+    _por_etiqueta(at.text_input, "Email: *").input("ana@email.com")
+    _por_etiqueta(at.checkbox, "Acepto los términos y condiciones *").check()
+    return _por_etiqueta(at.button, "🚀 Registrarse").click().run()
+
+
+# Cada ejecución sube un CSV con otra semilla: con los mismos bytes todas
+# menos la primera serían aciertos de caché y no medirían el parseo. El CSV
+# se genera en preparar(), fuera del tiempo medido.
+def _subir_csv(filas, streaming=False):
+    semillas = itertools.count()
+    siguiente = {}
+
+    def preparar():
+        siguiente["contenido"] = csv_sintetico(filas, next(semillas))
+
+    def accion(at):
+        _por_etiqueta(at.checkbox, "Modo streaming (archivos grandes)").set_value(streaming)
+        at.file_uploader[0].set_value((f"ventas_{filas}.csv", siguiente.pop("contenido"), "text/csv"))
+        return at.run()
+    accion.preparar = preparar
+    return accion
+
+
+def _agregar_tarea(at):
+    _por_etiqueta(at.text_input, "Nueva tarea:").input("Tarea de prueba")
+    return _por_etiqueta(at.button, "Agregar Tarea").click().run()
+
+
+# Interacciones por sección: (nombre, acción, lenta)
+def interacciones(filas_csv):
+    return {
+        "🎮 Widgets Interactivos": [
+            ("botón simple", _clic("Botón Simple"), False),
+            ("botón primario", _clic("Procesar Datos"), False),
+            ("slider", lambda at: _por_etiqueta(at.slider, "Selecciona valor:").set_value(75).run(), False),
+            ("texto", lambda at: _por_etiqueta(at.text_input, "Tu nombre:").input("Juan").run(), False),
+        ],
+        "📝 Entrada de Datos": [
+            ("formulario de registro", _formulario, False),
+        ],
+        "📁 Carga de Archivos": [
+            (f"csv {filas} filas", _subir_csv(filas), False) for filas in filas_csv
+        ] + [
+            (f"csv {filas} filas (streaming)", _subir_csv(filas, streaming=True), False) for filas in filas_csv
+        ],
+        "🎨 Layout y Contenedores": [
+            ("slider", lambda at: _por_etiqueta(at.slider, "Parámetro 1").set_value(80).run(), False),
+        ],
+        "📈 Gráficos y Charts": [
+            (f"serie {filas} filas", (lambda f: lambda at: _por_etiqueta(at.selectbox, "Filas de la serie:").select(f).run())(filas), False)
+            for filas in (20, 100_000, 1_000_000)
+        ],
+        "💾 Estado de Sesión": [
+            ("incrementar", _clic("➕ Incrementar"), False),
+            ("agregar tarea", _agregar_tarea, False),
+        ],
+        "⚡ Funciones de Control": [
+            ("globos", _clic("🎈 Globos"), False),
+            ("simular proceso", _clic("Simular Proceso"), True),
+            ("spinner", _clic("Cargar con Spinner"), True),
+        ],
+    }
+
+
+def _estadisticas(tiempos):
+    ms = np.array(tiempos) * 1000
+    return {
+        "n": len(ms),
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p90_ms": round(float(np.percentile(ms, 90)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+        "max_ms": round(float(ms.max()), 3),
+    }
+
+
+# Mide una acción: latencias sin tracemalloc y una ejecución extra con
+# tracemalloc para el pico de memoria de Python asignada durante el rerun.
+# Si la acción tiene preparar(), se llama antes de cada ejecución sin medirla.
+def medir(at, accion, repeticiones):
+    preparar = getattr(accion, "preparar", lambda: None)
+    tiempos, errores = [], []
+    for _ in range(repeticiones):
+        preparar()
+        inicio = time.perf_counter()
+        accion(at)
+        tiempos.append(time.perf_counter() - inicio)
+        errores.extend(e.message for e in at.exception)
+
+    preparar()
+    tracemalloc.start()
+    accion(at)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    resultado = _estadisticas(tiempos)
+    resultado["pico_memoria_bytes"] = pico
+    resultado["errores"] = sorted(set(errores))
+    return resultado
+
+
+def ejecutar(repeticiones, filas_csv, omitir_lentas, timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.run()
+    selector = at.sidebar.selectbox[0]
+    secciones = list(selector.options)
+    por_seccion = interacciones(filas_csv)
+
+    escenarios = []
+    for seccion in secciones:
+        # Cada sección empieza con el estado de sesión limpio
+        at = AppTest.from_file(APP, default_timeout=timeout)
+        at.run()
+        print(f"{seccion}", file=sys.stderr)
+
+        def seleccionar(at, seccion=seccion):
+            return at.sidebar.selectbox[0].select(seccion).run()
+
+        escenarios.append({"seccion": seccion, "interaccion": "seleccionar", **medir(at, seleccionar, repeticiones)})
+        for nombre, accion, lenta in por_seccion.get(seccion, []):
+            if lenta and omitir_lentas:
+                continue
+            print(f"  {nombre}", file=sys.stderr)
+            n = min(repeticiones, 3) if lenta else repeticiones
+            escenarios.append({"seccion": seccion, "interaccion": nombre, **medir(at, accion, n)})
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": st.__version__,
+        "repeticiones": repeticiones,
+        "escenarios": escenarios,
+        # ru_maxrss: KB en Linux, bytes en macOS
+        "maxrss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticiones", type=int, default=10, help="reruns medidos por interacción")
+    parser.add_argument("--filas-csv", default="1000,10000,100000",
+                        help="tamaños de los CSV sintéticos, separados por comas")
+    parser.add_argument("--omitir-lentas", action="store_true",
+                        help="no ejecutar las demos que duermen (progreso, spinner)")
+    parser.add_argument("--timeout", type=float, default=120, help="segundos máximos por rerun")
+    parser.add_argument("--salida", default="bench.json", help="ruta del reporte JSON")
+    args = parser.parse_args()
+
+    # Todo lo que la app escribe en disco va a un directorio temporal, para no
+    # mezclarlo con (ni ensuciar) los datos reales del usuario
+    temporal = tempfile.mkdtemp(prefix="st-app-bench-")
+    for variable, nombre in [
+        ("ST_APP_CACHE_DIR", "datasets"),
+        ("ST_APP_EXPORT_DIR", "exports"),
+        ("ST_APP_REGISTROS_DB", "registros.sqlite3"),
+        ("ST_APP_TRABAJOS_DB", "trabajos.sqlite3"),
+        ("ST_APP_METRICAS", "metricas.prom"),
+    ]:
+        os.environ.setdefault(variable, os.path.join(temporal, nombre))
+    # Los escenarios grandes (1M filas) solo se ofrecen en modo administrador
+    os.environ.setdefault("ST_APP_ADMIN", "1")
+    filas_csv = [int(f) for f in args.filas_csv.split(",") if f]
+
+    reporte = ejecutar(args.repeticiones, filas_csv, args.omitir_lentas, args.timeout)
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(reporte, f, ensure_ascii=False, indent=2)
+
+    for e in reporte["escenarios"]:
+        estado = "ERROR" if e["errores"] else ""
+        print(f"{e['seccion']:<28} {e['interaccion']:<28} p50 {e['p50_ms']:>9.1f} ms  "
+              f"p99 {e['p99_ms']:>9.1f} ms  pico {e['pico_memoria_bytes'] / 1e6:>8.1f} MB {estado}")
+
+
+if __name__ == "__main__":
+    main()
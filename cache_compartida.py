@@ -0,0 +1,180 @@
+import streamlit as st
+import functools
+import hashlib
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sesion.memoria import tamano
+
+# Límites por defecto de un espacio de caché
+MAX_ENTRADAS = 128
+MAX_BYTES = 256 * 1024 * 1024
+# Caducidad de los datos de ejemplo constantes de las secciones
+TTL_SECCIONES = 3600
+# El botón para vaciar todos los espacios (afecta a todas las sesiones) solo
+# aparece con ST_APP_ADMIN=1
+ADMIN = os.environ.get("ST_APP_ADMIN", "") not in ("", "0")
+
+_FALTA = object()
+
+
+# Un espacio de la caché compartida: LRU con límite de entradas, de bytes y
+# TTL opcional (segundos), más contadores de aciertos, fallos y desalojos.
+# Los valores se comparten entre sesiones sin copiarse: tratarlos como solo
+# lectura. `medir` estima los bytes de un valor al guardarlo.
+class EspacioCache:
+    def __init__(self, nombre, max_entradas=MAX_ENTRADAS, max_bytes=MAX_BYTES, ttl=None, medir=tamano):
+        self.nombre = nombre
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.medir = medir
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._entradas = OrderedDict()  # clave -> (valor, bytes, caduca)
+        self._lock = threading.Lock()
+
+    def buscar(self, clave, defecto=None):
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[2] is not None and entrada[2] < time.monotonic():
+                self._quitar(clave)
+                entrada = None
+            if entrada is None:
+                self.fallos += 1
+                return defecto
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[0]
+
+    def get(self, clave):
+        return self.buscar(clave)
+
+    def put(self, clave, valor):
+        bytes_valor = self.medir(valor)
+        # Un valor más grande que todo el presupuesto no se guarda
+        if bytes_valor > self.max_bytes:
+            return
+        caduca = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = (valor, bytes_valor, caduca)
+            self.bytes_usados += bytes_valor
+            while len(self._entradas) > self.max_entradas or self.bytes_usados > self.max_bytes:
+                self._quitar(next(iter(self._entradas)))
+                self.desalojos += 1
+
+    # Gancho de invalidación: una clave o, sin argumentos, el espacio entero
+    def invalidar(self, clave=_FALTA):
+        with self._lock:
+            if clave is _FALTA:
+                self._entradas.clear()
+                self.bytes_usados = 0
+            elif clave in self._entradas:
+                self._quitar(clave)
+
+    def _quitar(self, clave):
+        _, bytes_valor, _ = self._entradas.pop(clave)
+        self.bytes_usados -= bytes_valor
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+@st.cache_resource
+def _registro():
+    return {}, threading.Lock()
+
+
+# Identidad comparable de un límite. `medir` se compara por nombre: Streamlit
+# recarga los módulos editados y la función pasa a ser otro objeto.
+def _comparable(valor):
+    if callable(valor):
+        return (getattr(valor, "__module__", None), getattr(valor, "__qualname__", None))
+    return valor
+
+
+# Espacio por nombre, creado con sus límites la primera vez que se pide.
+# Pedirlo después con límites distintos es un error: se ignorarían en silencio.
+def espacio(nombre, **limites):
+    espacios, lock = _registro()
+    with lock:
+        if nombre not in espacios:
+            espacios[nombre] = EspacioCache(nombre, **limites)
+        esp = espacios[nombre]
+    distintos = {k: v for k, v in limites.items() if _comparable(getattr(esp, k)) != _comparable(v)}
+    if distintos:
+        raise ValueError(f"El espacio '{nombre}' ya existe con otros límites: {distintos}")
+    return esp
+
+
+# Vacía un espacio o, sin nombre, todos
+def invalidar(nombre=None):
+    espacios, lock = _registro()
+    with lock:
+        objetivo = list(espacios.values()) if nombre is None else [espacios[nombre]] if nombre in espacios else []
+    for esp in objetivo:
+        esp.invalidar()
+
+
+# Decorador: guarda el resultado en el espacio `nombre` según los argumentos.
+# Como en st.cache_resource, los parámetros que empiezan por "_" no forman
+# parte de la clave. La función decorada gana .invalidar(*args, **kwargs) para
+# descartar una llamada concreta (o todo el espacio sin argumentos).
+def cacheado(nombre, **limites):
+    def decorador(funcion):
+        firma = inspect.signature(funcion)
+
+        def clave(args, kwargs):
+            ligados = firma.bind(*args, **kwargs)
+            ligados.apply_defaults()
+            partes = [(k, v) for k, v in ligados.arguments.items() if not k.startswith("_")]
+            texto = repr((funcion.__module__, funcion.__qualname__, partes))
+            return hashlib.blake2b(texto.encode(), digest_size=16).hexdigest()
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            esp = espacio(nombre, **limites)
+            k = clave(args, kwargs)
+            valor = esp.buscar(k, _FALTA)
+            if valor is _FALTA:
+                valor = funcion(*args, **kwargs)
+                esp.put(k, valor)
+            return valor
+
+        def invalidar_llamada(*args, **kwargs):
+            esp = espacio(nombre, **limites)
+            if args or kwargs:
+                esp.invalidar(clave(args, kwargs))
+            else:
+                esp.invalidar()
+
+        envoltura.invalidar = invalidar_llamada
+        return envoltura
+    return decorador
+
+
+# Contadores de todos los espacios para la barra lateral, con botón para
+# vaciar si la app corre en modo administrador (ver ADMIN)
+def mostrar_contadores():
+    espacios, lock = _registro()
+    with lock:
+        lista = sorted(espacios.values(), key=lambda e: e.nombre)
+    with st.sidebar.expander("🗄️ Caché compartida"):
+        if not lista:
+            st.caption("Todavía vacía")
+        for esp in lista:
+            consultas = esp.aciertos + esp.fallos
+            tasa = esp.aciertos / consultas * 100 if consultas else 0
+            st.caption(
+                f"**{esp.nombre}**: {tasa:.0f}% aciertos ({esp.aciertos}/{consultas}) · "
+                f"{len(esp)} entradas · {esp.bytes_usados / 1024 / 1024:.1f} MB · {esp.desalojos} desalojos"
+            )
+        if ADMIN and st.button("🧹 Vaciar cachés", key="vaciar-cache-compartida"):
+            invalidar()
@@ -0,0 +1 @@
+# Capa de datos de la app: ingesta, caché y procesamiento de archivos subidos
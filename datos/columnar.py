@@ -0,0 +1,146 @@
+import pyarrow as pa
+import hashlib
+import json
+import os
+import threading
+import time
+
+from monitoreo import instrumentado
+
+# Directorio y tamaño máximo de la caché en disco (configurables por entorno)
+DIRECTORIO_CACHE = os.environ.get(
+    "ST_APP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "st-app", "datasets")
+)
+TAMANO_MAXIMO = int(os.environ.get("ST_APP_CACHE_BYTES", 2 * 1024 * 1024 * 1024))
+
+_lock = threading.Lock()
+# Archivos cuyo checksum ya se comprobó en este proceso
+_verificados = set()
+
+
+def _ruta_datos(clave):
+    return os.path.join(DIRECTORIO_CACHE, f"{clave}.arrow")
+
+
+def _ruta_meta(clave):
+    return os.path.join(DIRECTORIO_CACHE, f"{clave}.json")
+
+
+def _checksum(ruta):
+    h = hashlib.blake2b(digest_size=16)
+    with open(ruta, "rb") as f:
+        for bloque in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def _leer_meta(clave):
+    try:
+        with open(_ruta_meta(clave), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _escribir_meta(clave, meta):
+    temporal = _ruta_meta(clave) + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(temporal, _ruta_meta(clave))
+
+
+def _borrar(clave):
+    _verificados.discard(clave)
+    for ruta in (_ruta_datos(clave), _ruta_meta(clave)):
+        try:
+            os.remove(ruta)
+        except FileNotFoundError:
+            pass
+
+
+# Guarda un DataFrame como archivo Arrow IPC bajo su hash de contenido.
+# `extra` se añade a los metadatos. Devuelve False si el frame no se puede
+# representar en Arrow.
+def guardar(clave, df, nombre, extra=None):
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    try:
+        tabla = pa.Table.from_pandas(df)
+    except (pa.ArrowException, ValueError, TypeError):
+        return False
+
+    temporal = _ruta_datos(clave) + ".tmp"
+    with pa.OSFile(temporal, "wb") as sink:
+        with pa.ipc.new_file(sink, tabla.schema) as writer:
+            writer.write_table(tabla)
+    with _lock:
+        os.replace(temporal, _ruta_datos(clave))
+        _escribir_meta(clave, {
+            "nombre": nombre,
+            "filas": tabla.num_rows,
+            "columnas": tabla.num_columns,
+            "bytes": os.path.getsize(_ruta_datos(clave)),
+            "checksum": _checksum(_ruta_datos(clave)),
+            "ultimo_acceso": time.time(),
+            **(extra or {}),
+        })
+        _verificados.add(clave)
+        _desalojar()
+    return True
+
+
+def metadatos(clave):
+    return _leer_meta(clave)
+
+
+def existe(clave):
+    return os.path.exists(_ruta_datos(clave)) and os.path.exists(_ruta_meta(clave))
+
+
+# Carga un dataset de la caché mapeando el archivo en memoria.
+# Devuelve None si no existe o si falla la comprobación de integridad.
+@instrumentado("arrow_cargar")
+def cargar(clave):
+    meta = _leer_meta(clave)
+    ruta = _ruta_datos(clave)
+    if meta is None or not os.path.exists(ruta):
+        return None
+
+    with _lock:
+        if os.path.getsize(ruta) != meta["bytes"] or (
+            clave not in _verificados and _checksum(ruta) != meta["checksum"]
+        ):
+            # Archivo truncado o corrupto: se descarta
+            _borrar(clave)
+            return None
+        _verificados.add(clave)
+        meta["ultimo_acceso"] = time.time()
+        _escribir_meta(clave, meta)
+
+    with pa.memory_map(ruta, "r") as fuente:
+        tabla = pa.ipc.open_file(fuente).read_all()
+    return tabla.to_pandas()
+
+
+# Datasets en caché, del más reciente al más antiguo: [(clave, meta), ...]
+def recientes():
+    if not os.path.isdir(DIRECTORIO_CACHE):
+        return []
+    entradas = []
+    for archivo in os.listdir(DIRECTORIO_CACHE):
+        if archivo.endswith(".json"):
+            clave = archivo[:-len(".json")]
+            meta = _leer_meta(clave)
+            if meta is not None:
+                entradas.append((clave, meta))
+    return sorted(entradas, key=lambda e: e[1]["ultimo_acceso"], reverse=True)
+
+
+# Elimina los datasets usados hace más tiempo hasta respetar TAMANO_MAXIMO
+def _desalojar():
+    entradas = recientes()
+    total = sum(meta["bytes"] for _, meta in entradas)
+    while entradas and total > TAMANO_MAXIMO:
+        clave, meta = entradas.pop()
+        _borrar(clave)
+        total -= meta["bytes"]
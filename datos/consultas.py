@@ -0,0 +1,166 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import threading
+
+from monitoreo import instrumentado
+
+FUNCIONES_AGREGACION = ["count", "sum", "mean", "min", "max"]
+
+
+# Motor de consultas sobre un DataFrame subido. Construye bajo demanda (y
+# conserva) un índice por columna:
+# - categórico: códigos + posiciones de las filas agrupadas por categoría
+# - ordenado: argsort de la columna numérica y sus valores ordenados
+# Cada filtro se resuelve con búsquedas en el índice más selectivo y el resto
+# se comprueba solo sobre esas filas, sin recorrer el frame completo.
+class MotorConsultas:
+    def __init__(self, df):
+        self.df = df
+        self._categoricos = {}
+        self._ordenados = {}
+        self._lock = threading.Lock()
+
+    def columnas_categoricas(self):
+        return [c for c in self.df.columns if not pd.api.types.is_numeric_dtype(self.df[c])
+                or pd.api.types.is_bool_dtype(self.df[c])]
+
+    def columnas_numericas(self):
+        return [c for c in self.df.columns if pd.api.types.is_numeric_dtype(self.df[c])
+                and not pd.api.types.is_bool_dtype(self.df[c])]
+
+    def indice_categorico(self, col):
+        with self._lock:
+            if col not in self._categoricos:
+                codigos, categorias = pd.factorize(self.df[col], sort=True)
+                # intp: bincount y la indexación no necesitan convertir
+                codigos = codigos.astype(np.intp)
+                # Filas ordenadas por categoría (NaN, código -1, quedan al principio)
+                orden = np.argsort(codigos, kind="stable")
+                limites = np.searchsorted(codigos[orden], np.arange(-1, len(categorias) + 1))
+                self._categoricos[col] = (codigos, categorias, orden, limites)
+            return self._categoricos[col]
+
+    def indice_ordenado(self, col):
+        with self._lock:
+            if col not in self._ordenados:
+                valores = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                orden = np.argsort(valores, kind="stable")
+                self._ordenados[col] = (valores, orden, valores[orden])
+            return self._ordenados[col]
+
+    def categorias(self, col):
+        return list(self.indice_categorico(col)[1])
+
+    def rango(self, col):
+        _, _, ordenados = self.indice_ordenado(col)
+        validos = ordenados[~np.isnan(ordenados)]
+        return (float(validos[0]), float(validos[-1])) if len(validos) else (0.0, 0.0)
+
+    # Posiciones de las filas cuyo valor en `col` está en `valores`
+    def _filas_categoria(self, col, valores):
+        _, categorias, orden, limites = self.indice_categorico(col)
+        codigos = categorias.get_indexer(valores)
+        partes = [orden[limites[c + 1]:limites[c + 2]] for c in codigos if c >= 0]
+        return np.concatenate(partes) if partes else np.empty(0, dtype=np.int64)
+
+    # Posiciones de las filas con `minimo <= col <= maximo`
+    def _filas_rango(self, col, minimo, maximo):
+        _, orden, ordenados = self.indice_ordenado(col)
+        inicio = np.searchsorted(ordenados, minimo, side="left")
+        fin = np.searchsorted(ordenados, maximo, side="right")
+        return orden[inicio:fin]
+
+    def _tamano_estimado(self, filtro):
+        tipo, col, argumento = filtro
+        if tipo == "categoria":
+            _, categorias, _, limites = self.indice_categorico(col)
+            return sum(limites[c + 2] - limites[c + 1] for c in categorias.get_indexer(argumento) if c >= 0)
+        _, _, ordenados = self.indice_ordenado(col)
+        return np.searchsorted(ordenados, argumento[1], side="right") - np.searchsorted(ordenados, argumento[0])
+
+    # Filtros: [("categoria", col, [valores]), ("rango", col, (min, max)), ...]
+    # Devuelve las posiciones (ordenadas) de las filas que cumplen todos.
+    @instrumentado("consulta filtrar")
+    def filtrar(self, filtros):
+        if not filtros:
+            return np.arange(len(self.df))
+        filtros = sorted(filtros, key=self._tamano_estimado)
+        tipo, col, argumento = filtros[0]
+        if tipo == "categoria":
+            filas = self._filas_categoria(col, argumento)
+        else:
+            filas = self._filas_rango(col, *argumento)
+        for tipo, col, argumento in filtros[1:]:
+            if tipo == "categoria":
+                codigos, categorias, _, _ = self.indice_categorico(col)
+                filas = filas[np.isin(codigos[filas], categorias.get_indexer(argumento))]
+            else:
+                valores = self.indice_ordenado(col)[0][filas]
+                filas = filas[(valores >= argumento[0]) & (valores <= argumento[1])]
+        if len(filas) == len(self.df):
+            return np.arange(len(self.df))
+        return self._en_orden(filas)
+
+    # Posiciones en orden de fila: con muchas filas una máscara es más barata que sort
+    def _en_orden(self, filas):
+        if len(filas) > len(self.df) // 16:
+            mascara = np.zeros(len(self.df), dtype=bool)
+            mascara[filas] = True
+            return np.flatnonzero(mascara)
+        return np.sort(filas)
+
+    # Ordena las posiciones por una columna usando el orden ya guardado en su
+    # índice (categórico o numérico) siempre que compense frente a un argsort
+    @instrumentado("consulta ordenar")
+    def ordenar(self, filas, col, ascendente=True):
+        if col in self.columnas_numericas():
+            valores, orden, _ = self.indice_ordenado(col)
+        else:
+            valores, _, orden, _ = self.indice_categorico(col)
+        if len(filas) == len(self.df):
+            resultado = orden
+        elif len(filas) > len(self.df) // 16:
+            mascara = np.zeros(len(self.df), dtype=bool)
+            mascara[filas] = True
+            resultado = orden[mascara[orden]]
+        else:
+            resultado = filas[np.argsort(valores[filas], kind="stable")]
+        return resultado if ascendente else resultado[::-1]
+
+    # Agregación por categoría con bincount sobre los códigos del índice.
+    # Los códigos se desplazan en 1 para que las filas con NaN en `por`
+    # (código -1) caigan en el cubo 0 y se descarten sin copiar arrays.
+    @instrumentado("consulta agrupar")
+    def agrupar(self, filas, por, columna, funcion):
+        codigos, categorias, _, _ = self.indice_categorico(por)
+        completo = len(filas) == len(self.df)
+        grupos = (codigos if completo else codigos[filas]) + 1
+        cubos = len(categorias) + 1
+        conteos = np.bincount(grupos, minlength=cubos)[1:]
+
+        valores = self.indice_ordenado(columna)[0]
+        valores = valores if completo else valores[filas]
+        nulos = np.isnan(valores)
+        # Como en pandas, count y mean solo cuentan los valores no nulos
+        no_nulos = np.bincount(grupos, weights=~nulos, minlength=cubos)[1:]
+        if funcion == "count":
+            resultado = no_nulos.astype(np.int64)
+        elif funcion in ("sum", "mean"):
+            resultado = np.bincount(grupos, weights=np.where(nulos, 0.0, valores), minlength=cubos)[1:]
+            if funcion == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    resultado = resultado / no_nulos
+        else:
+            resultado = np.full(cubos, np.nan)
+            ufunc = np.fmin if funcion == "min" else np.fmax
+            ufunc.at(resultado, grupos, valores)
+            resultado = resultado[1:]
+        tabla = pd.DataFrame({por: categorias, f"{funcion}({columna})": resultado})
+        return tabla[conteos > 0].reset_index(drop=True)
+
+
+# Un motor (con sus índices) por dataset, compartido entre reruns y sesiones
+@st.cache_resource(max_entries=8)
+def obtener_motor(clave, _df):
+    return MotorConsultas(_df)
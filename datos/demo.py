@@ -0,0 +1,51 @@
+import pandas as pd
+import numpy as np
+import os
+
+from cache_compartida import cacheado, ADMIN
+from monitoreo import instrumentado
+
+# Semilla fija: los mismos datos en cada rerun, sesión y réplica
+SEMILLA = 42
+CENTRO_MAPA = (19.43, -99.13)  # Ciudad de México
+
+# Tamaños disponibles; el de por defecto se puede subir por entorno para
+# usar las mismas páginas como fixtures de pruebas de carga
+OPCIONES_FILAS = [20, 10_000, 100_000, 1_000_000, 10_000_000]
+OPCIONES_PUNTOS = [100, 100_000, 1_000_000, 10_000_000]
+FILAS_DEFECTO = int(os.environ.get("ST_APP_FILAS_DEMO", 20))
+PUNTOS_DEFECTO = int(os.environ.get("ST_APP_PUNTOS_MAPA", 100))
+# Tamaño máximo que cualquier visitante puede elegir. Los mayores (cientos de
+# MB compartidos) solo se ofrecen hasta el defecto subido por entorno, o todos
+# en modo administrador (ST_APP_ADMIN=1)
+MAXIMO_PUBLICO = 100_000
+# Memoria para los datasets demo en la caché compartida (10M filas ≈ 240 MB)
+MEMORIA_DEMOS = 1024 * 1024 * 1024
+
+
+# Opciones para un selectbox incluyendo el valor por defecto configurado,
+# sin pasar de MAXIMO_PUBLICO salvo que el defecto sea mayor
+def opciones_con_defecto(opciones, defecto):
+    if not ADMIN:
+        opciones = [o for o in opciones if o <= max(MAXIMO_PUBLICO, defecto)]
+    opciones = sorted(set(opciones) | {defecto})
+    return opciones, opciones.index(defecto)
+
+
+# Los datasets se generan una vez y se comparten entre sesiones (la caché
+# compartida no los copia): tratarlos como solo lectura.
+@cacheado("demos", max_bytes=MEMORIA_DEMOS)
+@instrumentado("np.random serie_demo")
+def serie_demo(filas, columnas=("A", "B", "C"), semilla=SEMILLA):
+    rng = np.random.default_rng(semilla)
+    return pd.DataFrame(rng.standard_normal((filas, len(columnas))), columns=list(columnas))
+
+
+@cacheado("demos", max_bytes=MEMORIA_DEMOS)
+@instrumentado("np.random mapa_demo")
+def mapa_demo(puntos, centro=CENTRO_MAPA, semilla=SEMILLA):
+    rng = np.random.default_rng(semilla)
+    return pd.DataFrame(
+        rng.standard_normal((puntos, 2)) / [50, 50] + list(centro),
+        columns=['lat', 'lon']
+    )
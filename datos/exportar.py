@@ -0,0 +1,121 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import numpy as np
+import hashlib
+import os
+import uuid
+
+from monitoreo import instrumentado
+
+# Directorio y tamaño máximo de los archivos exportados (configurables por entorno)
+DIRECTORIO_EXPORTS = os.environ.get(
+    "ST_APP_EXPORT_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "st-app", "exports")
+)
+TAMANO_MAXIMO = int(os.environ.get("ST_APP_EXPORT_BYTES", 2 * 1024 * 1024 * 1024))
+# Filas que se codifican de cada vez: la memoria no depende del tamaño del frame
+FILAS_POR_CHUNK = 100_000
+
+# Formato -> (extensión, tipo MIME)
+FORMATOS = {
+    "CSV": (".csv", "text/csv"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+    "Arrow (zstd)": (".arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+# Huella de lo que se exporta: dataset, filas (y su orden) y formato
+def _huella(clave, filas, formato):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{clave}|{formato}".encode())
+    if filas is not None:
+        h.update(np.ascontiguousarray(filas, dtype=np.int64).data)
+    return h.hexdigest()
+
+
+def _trozos(df, filas):
+    total = len(df) if filas is None else len(filas)
+    for inicio in range(0, max(total, 1), FILAS_POR_CHUNK):
+        if filas is None:
+            yield df.iloc[inicio:inicio + FILAS_POR_CHUNK]
+        else:
+            yield df.iloc[filas[inicio:inicio + FILAS_POR_CHUNK]]
+
+
+def _escribir_csv(trozos, ruta):
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        for i, trozo in enumerate(trozos):
+            trozo.to_csv(f, header=i == 0, index=False)
+
+
+# Parquet y Arrow: el esquema sale del primer trozo y el resto se ajusta a él
+def _escribir_arrow(trozos, ruta, parquet):
+    escritor = None
+    destino = None
+    try:
+        for trozo in trozos:
+            if escritor is None:
+                esquema = pa.Schema.from_pandas(trozo, preserve_index=False)
+                if parquet:
+                    escritor = pq.ParquetWriter(ruta, esquema, compression="zstd")
+                else:
+                    opciones = pa.ipc.IpcWriteOptions(compression="zstd")
+                    destino = pa.OSFile(ruta, "wb")
+                    escritor = pa.ipc.new_file(destino, esquema, options=opciones)
+            escritor.write_table(pa.Table.from_pandas(trozo, schema=esquema, preserve_index=False))
+    finally:
+        if escritor is not None:
+            escritor.close()
+        if destino is not None:
+            destino.close()
+
+
+# Codifica el frame (o las filas `filas`, en ese orden) en el formato pedido,
+# trozo a trozo y directamente a disco. El archivo queda como caché: volver a
+# exportar lo mismo devuelve la ruta sin recodificar. `clave` identifica el
+# dataset (p. ej. el hash del archivo subido).
+@instrumentado("exportar")
+def exportar(df, clave, formato, filas=None):
+    extension, _ = FORMATOS[formato]
+    ruta = os.path.join(DIRECTORIO_EXPORTS, _huella(clave, filas, formato) + extension)
+    if os.path.exists(ruta):
+        os.utime(ruta)
+        return ruta
+
+    os.makedirs(DIRECTORIO_EXPORTS, exist_ok=True)
+    # Temporal único: dos sesiones pueden exportar lo mismo a la vez
+    temporal = f"{ruta}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        if formato == "CSV":
+            _escribir_csv(_trozos(df, filas), temporal)
+        else:
+            _escribir_arrow(_trozos(df, filas), temporal, parquet=formato == "Parquet")
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    _desalojar(conservar=ruta)
+    return ruta
+
+
+# Borra las exportaciones usadas hace más tiempo hasta respetar TAMANO_MAXIMO
+# (nunca la que se acaba de pedir)
+def _desalojar(conservar):
+    archivos = []
+    for nombre in os.listdir(DIRECTORIO_EXPORTS):
+        ruta = os.path.join(DIRECTORIO_EXPORTS, nombre)
+        if nombre.endswith(".tmp") or ruta == conservar:
+            continue
+        try:
+            archivos.append((os.path.getmtime(ruta), os.path.getsize(ruta), ruta))
+        except FileNotFoundError:
+            pass
+    archivos.sort()
+    total = os.path.getsize(conservar) + sum(tamano for _, tamano, _ in archivos)
+    while archivos and total > TAMANO_MAXIMO:
+        _, tamano, ruta = archivos.pop(0)
+        try:
+            os.remove(ruta)
+        except FileNotFoundError:
+            pass
+        total -= tamano
@@ -0,0 +1,238 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import abc
+import os
+import socket
+import threading
+import time
+
+# Puntos que conserva cada fuente en vivo (el resto se descarta)
+CAPACIDAD_BUFFER = int(os.environ.get("ST_APP_BUFFER_VIVO", 100_000))
+# Archivo que se sigue (tail) y puerto UDP local que se escucha
+ARCHIVO_VIVO = os.environ.get(
+    "ST_APP_ARCHIVO_VIVO",
+    os.path.join(os.path.expanduser("~"), ".cache", "st-app", "telemetria.csv")
+)
+PUERTO_VIVO = int(os.environ.get("ST_APP_PUERTO_VIVO", 9999))
+# Una fuente sin lectores durante este tiempo detiene su hilo
+SEGUNDOS_INACTIVIDAD = 60
+COLUMNAS = ("A", "B", "C")
+
+
+# Fuentes de series en vivo. Todas exponen la misma interfaz:
+# - ultimas(n) -> (df con los últimos n puntos, total producido hasta ahora)
+# El índice del df es la posición absoluta (nº de punto desde el inicio) y el
+# total permite saber si llegaron puntos nuevos desde la última lectura.
+
+
+# Reproduce un DataFrame existente como si llegara en vivo: el total crece con
+# el tiempo transcurrido a `velocidad` puntos por segundo. No usa hilos.
+class ReproduccionSerie:
+    def __init__(self, df, velocidad):
+        self.df = df.reset_index(drop=True)
+        self.velocidad = velocidad
+        self._inicio = time.monotonic()
+
+    @property
+    def total(self):
+        transcurrido = time.monotonic() - self._inicio
+        return min(len(self.df), int(transcurrido * self.velocidad))
+
+    @property
+    def terminada(self):
+        return self.total >= len(self.df)
+
+    def ultimas(self, n):
+        total = self.total
+        return self.df.iloc[max(0, total - n):total], total
+
+
+# Buffer circular de tamaño fijo sobre un array NumPy (capacidad × columnas).
+# Escribir no reserva memoria: los puntos más antiguos se sobrescriben.
+class BufferCircular:
+    def __init__(self, capacidad, columnas=COLUMNAS):
+        self.columnas = list(columnas)
+        self._datos = np.full((capacidad, len(columnas)), np.nan)
+        self.total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacidad(self):
+        return len(self._datos)
+
+    @property
+    def bytes(self):
+        return self._datos.nbytes
+
+    # Un lote mayor que el buffer cuenta entero en `total`, pero solo se
+    # escriben sus últimas `capacidad` filas, en la posición que les toca
+    def agregar(self, filas):
+        filas = np.asarray(filas, dtype=np.float64)
+        n = len(filas)
+        filas = filas[-self.capacidad:]
+        with self._lock:
+            inicio = (self.total + n - len(filas)) % self.capacidad
+            primero = min(len(filas), self.capacidad - inicio)
+            self._datos[inicio:inicio + primero] = filas[:primero]
+            self._datos[:len(filas) - primero] = filas[primero:]
+            self.total += n
+
+    # Los puntos ya sobrescritos no se pueden pedir: se empieza por el más antiguo
+    def desde(self, posicion):
+        with self._lock:
+            total = self.total
+            posicion = max(posicion, total - self.capacidad, 0)
+            posiciones = np.arange(posicion, total)
+            filas = self._datos[posiciones % self.capacidad]
+        return pd.DataFrame(filas, index=posiciones, columns=self.columnas), total
+
+    def ultimas(self, n):
+        return self.desde(self.total - min(n, self.capacidad))
+
+
+# Fuente que llena un BufferCircular desde un hilo propio. El hilo arranca con
+# la primera lectura y se detiene solo si nadie lee en SEGUNDOS_INACTIVIDAD,
+# así una fuente compartida no consume CPU cuando nadie la mira.
+class FuenteViva(abc.ABC):
+    terminada = False
+
+    def __init__(self, capacidad=CAPACIDAD_BUFFER):
+        self.buffer = BufferCircular(capacidad)
+        self.error = None
+        self._ultima_lectura = time.monotonic()
+        self._hilo = None
+        self._lock = threading.Lock()
+
+    def _asegurar_hilo(self):
+        self._ultima_lectura = time.monotonic()
+        with self._lock:
+            if self._hilo is None or not self._hilo.is_alive():
+                # El error de una ejecución anterior (p. ej. el archivo aún no
+                # existía) no se arrastra a la nueva
+                self.error = None
+                self._hilo = threading.Thread(target=self._ejecutar, name=f"fuente-{type(self).__name__}", daemon=True)
+                self._hilo.start()
+
+    def _activa(self):
+        return time.monotonic() - self._ultima_lectura < SEGUNDOS_INACTIVIDAD
+
+    def _ejecutar(self):
+        try:
+            self.producir()
+        except Exception as e:
+            self.error = str(e)
+
+    # Bucle de las subclases: añade filas al buffer mientras self._activa()
+    @abc.abstractmethod
+    def producir(self):
+        pass
+
+    def ultimas(self, n):
+        self._asegurar_hilo()
+        return self.buffer.ultimas(n)
+
+
+# Filas numéricas a partir de líneas "a,b,c"; las líneas inválidas se ignoran
+# y las cortas se completan con NaN
+def _parsear_lineas(lineas, columnas=len(COLUMNAS)):
+    filas = []
+    for linea in lineas:
+        try:
+            valores = [float(v) for v in linea.strip().split(",")[:columnas] if v.strip()]
+        except ValueError:
+            continue
+        if valores:
+            filas.append(valores + [np.nan] * (columnas - len(valores)))
+    return filas
+
+
+# Telemetría simulada: paseo aleatorio, seno y ruido a `frecuencia` puntos/s,
+# generados en lotes cada ~20 ms
+class FuenteGenerador(FuenteViva):
+    def __init__(self, frecuencia, capacidad=CAPACIDAD_BUFFER):
+        super().__init__(capacidad)
+        self.frecuencia = frecuencia
+
+    def producir(self):
+        rng = np.random.default_rng()
+        nivel = 0.0
+        anterior = time.monotonic()
+        pendiente = 0.0
+        while self._activa():
+            time.sleep(0.02)
+            ahora = time.monotonic()
+            pendiente += (ahora - anterior) * self.frecuencia
+            anterior = ahora
+            n = int(pendiente)
+            if n == 0:
+                continue
+            pendiente -= n
+            paseo = nivel + np.cumsum(rng.standard_normal(n)) * 0.1
+            nivel = paseo[-1]
+            t = (self.buffer.total + np.arange(n)) / self.frecuencia
+            self.buffer.agregar(np.column_stack([paseo, np.sin(t), rng.standard_normal(n)]))
+
+
+# Sigue un archivo de texto (como tail -f) con líneas "a,b,c". Empieza por el
+# final y vuelve al principio si el archivo se trunca o se rota.
+class FuenteArchivo(FuenteViva):
+    def __init__(self, ruta, capacidad=CAPACIDAD_BUFFER):
+        super().__init__(capacidad)
+        self.ruta = ruta
+
+    def producir(self):
+        while not os.path.exists(self.ruta):
+            if not self._activa():
+                return
+            time.sleep(0.5)
+        with open(self.ruta, encoding="utf-8", errors="replace") as archivo:
+            archivo.seek(0, os.SEEK_END)
+            resto = ""
+            while self._activa():
+                bloque = archivo.read()
+                if not bloque:
+                    if os.path.getsize(self.ruta) < archivo.tell():
+                        archivo.seek(0)
+                        resto = ""
+                    time.sleep(0.05)
+                    continue
+                # Una línea incompleta se guarda hasta que llegue el resto
+                *lineas, resto = (resto + bloque).split("\n")
+                filas = _parsear_lineas(lineas)
+                if filas:
+                    self.buffer.agregar(filas)
+
+
+# Escucha datagramas UDP en localhost; cada uno trae una o varias líneas "a,b,c"
+class FuenteSocket(FuenteViva):
+    def __init__(self, puerto, capacidad=CAPACIDAD_BUFFER):
+        super().__init__(capacidad)
+        self.puerto = puerto
+
+    def producir(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as conexion:
+            conexion.bind(("127.0.0.1", self.puerto))
+            conexion.settimeout(0.2)
+            while self._activa():
+                try:
+                    datos = conexion.recv(65536)
+                except socket.timeout:
+                    continue
+                filas = _parsear_lineas(datos.decode("utf-8", errors="replace").splitlines())
+                if filas:
+                    self.buffer.agregar(filas)
+
+
+TIPOS_FUENTE = ["Generador local", "Archivo (tail)", "Socket UDP"]
+
+
+# Una fuente por tipo (y frecuencia, para el generador) compartida entre
+# sesiones: todas las pestañas que miran la misma telemetría leen el mismo buffer
+@st.cache_resource(max_entries=8)
+def obtener_fuente(tipo, frecuencia=1_000):
+    if tipo == "Generador local":
+        return FuenteGenerador(frecuencia)
+    if tipo == "Archivo (tail)":
+        return FuenteArchivo(ARCHIVO_VIVO)
+    return FuenteSocket(PUERTO_VIVO)
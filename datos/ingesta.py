@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+import hashlib
+
+from cache_compartida import espacio
+from datos import columnar
+from datos.tipos import optimizar_tipos
+from monitoreo import medir
+
+# Presupuesto de memoria para los DataFrames parseados (compartido entre sesiones)
+MEMORIA_MAXIMA = 512 * 1024 * 1024
+# Hashes de subidas recordados por sesión (file_id -> hash)
+MAX_HASHES_SESION = 64
+
+
+# Un único espacio de la caché compartida para los frames parseados,
+# reutilizado entre reruns y sesiones
+def obtener_cache():
+    return espacio("datasets", max_bytes=MEMORIA_MAXIMA)
+
+
+# Hash del contenido del archivo (no del nombre): el mismo CSV da la misma clave.
+# Se calcula una vez por subida (file_id) y se guarda en la sesión, así los
+# reruns posteriores son una búsqueda en un diccionario.
+def hash_archivo(uploaded_file):
+    hashes = st.session_state.setdefault("hashes_subidas", {})
+    clave = hashes.get(uploaded_file.file_id)
+    if clave is None:
+        clave = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+        hashes[uploaded_file.file_id] = clave
+        while len(hashes) > MAX_HASHES_SESION:
+            del hashes[next(iter(hashes))]
+    return clave
+
+
+# Lee un CSV subido reutilizando el DataFrame ya parseado si el contenido coincide:
+# primero en memoria, luego en la caché columnar en disco y solo al final parsea.
+# Al parsear se compactan los tipos; el reporte queda en los metadatos de la
+# caché columnar (ver reporte_tipos). El frame devuelto es compartido: no debe
+# modificarse en el sitio. `clave` es el hash si quien llama ya lo tiene.
+def leer_csv(uploaded_file, clave=None):
+    cache = obtener_cache()
+    if clave is None:
+        clave = hash_archivo(uploaded_file)
+    df = cache.get(clave)
+    if df is None:
+        df = columnar.cargar(clave)
+        if df is None:
+            uploaded_file.seek(0)
+            with medir("read_csv"):
+                df = pd.read_csv(uploaded_file)
+            df, tipos = optimizar_tipos(df)
+            columnar.guardar(clave, df, uploaded_file.name, {"tipos": tipos})
+        cache.put(clave, df)
+    return df
+
+
+# Abre un dataset de la lista de recientes (por su hash) sin volver a parsearlo
+def leer_reciente(clave):
+    cache = obtener_cache()
+    df = cache.get(clave)
+    if df is None:
+        df = columnar.cargar(clave)
+        if df is not None:
+            cache.put(clave, df)
+    return df
+
+
+# Reporte de tipos de un dataset (por su hash), o None si no se conoce
+def reporte_tipos(clave):
+    meta = columnar.metadatos(clave)
+    return meta.get("tipos") if meta else None
@@ -0,0 +1,84 @@
+import pandas as pd
+import numpy as np
+
+from monitoreo import instrumentado
+
+# Presupuesto de puntos por gráfico (~2 puntos por píxel de ancho)
+PUNTOS_MAXIMOS = 2000
+METODOS = ["LTTB", "Min/Max"]
+
+
+# Largest-Triangle-Three-Buckets: índices de los n puntos que mejor
+# conservan la forma visual de la serie
+def lttb(x, y, n):
+    total = len(y)
+    if n >= total or n < 3:
+        return np.arange(total)
+
+    indices = np.empty(n, dtype=np.int64)
+    indices[0], indices[-1] = 0, total - 1
+    bordes = np.linspace(1, total - 1, n - 1).astype(np.int64)
+    anterior = 0
+    for i in range(n - 2):
+        inicio, fin = bordes[i], bordes[i + 1]
+        # Promedio del bucket siguiente (el último punto para el último bucket)
+        if i + 2 < len(bordes):
+            x_sig = x[fin:bordes[i + 2]].mean()
+            y_sig = y[fin:bordes[i + 2]].mean()
+        else:
+            x_sig, y_sig = x[-1], y[-1]
+        areas = np.abs(
+            (x[anterior] - x_sig) * (y[inicio:fin] - y[anterior])
+            - (x[anterior] - x[inicio:fin]) * (y_sig - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        indices[i + 1] = anterior
+    return indices
+
+
+# Mínimo y máximo de cada bucket: conserva picos, útil para series ruidosas
+def minmax(y, n):
+    total = len(y)
+    buckets = n // 2
+    if n >= total or buckets < 1:
+        return np.arange(total)
+
+    # Buckets de igual tamaño como matriz (vectorizado); el resto va aparte
+    tamano = total // buckets
+    cuerpo = y[:tamano * buckets].reshape(buckets, tamano)
+    base = np.arange(buckets) * tamano
+    indices = [base + cuerpo.argmin(axis=1), base + cuerpo.argmax(axis=1)]
+    resto = y[tamano * buckets:]
+    if len(resto):
+        indices.append(tamano * buckets + np.array([np.argmin(resto), np.argmax(resto)]))
+    return np.unique(np.concatenate(indices))
+
+
+# Valores numéricos del eje x: el índice si es numérico o temporal, si no la posición
+def _eje_x(index):
+    if pd.api.types.is_datetime64_any_dtype(index):
+        return index.asi8.astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+# Reduce un DataFrame a ~n_puntos filas sin tocar el original.
+# Cada columna numérica elige sus puntos y se conserva la unión de todos.
+@instrumentado("reducir")
+def reducir(df, n_puntos=PUNTOS_MAXIMOS, metodo="LTTB"):
+    columnas = df.select_dtypes("number").columns
+    if len(df) <= n_puntos or len(columnas) == 0:
+        return df
+
+    por_columna = max(n_puntos // len(columnas), 4)
+    x = _eje_x(df.index)
+    seleccion = []
+    for col in columnas:
+        y = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        y = np.nan_to_num(y, nan=np.nanmean(y) if not np.isnan(y).all() else 0.0)
+        if metodo == "Min/Max":
+            seleccion.append(minmax(y, por_columna))
+        else:
+            seleccion.append(lttb(x, y, por_columna))
+    return df.iloc[np.unique(np.concatenate(seleccion))]
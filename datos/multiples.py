@@ -0,0 +1,128 @@
+import streamlit as st
+import pandas as pd
+import io
+import json
+import os
+import time
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from datos.tipos import optimizar_tipos
+
+# Workers por pool; Excel (CPU) va a procesos, el resto a hilos
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+EXTENSIONES_CPU = {"xlsx"}
+
+
+# Parsea un archivo a DataFrame (csv/xlsx/json) o a un resumen de texto (txt).
+# Se ejecuta dentro de un worker, por eso recibe bytes y no el UploadedFile.
+def parsear_archivo(nombre, contenido):
+    inicio = time.perf_counter()
+    resultado = {"nombre": nombre, "tipo": None, "datos": None, "error": None}
+    extension = nombre.rsplit(".", 1)[-1].lower()
+    try:
+        if extension == "csv":
+            resultado["datos"] = pd.read_csv(io.BytesIO(contenido))
+        elif extension == "xlsx":
+            resultado["datos"] = pd.read_excel(io.BytesIO(contenido))
+        elif extension == "json":
+            resultado["datos"] = _parsear_json(contenido)
+        elif extension == "txt":
+            resultado["datos"] = _resumir_texto(contenido)
+        else:
+            raise ValueError(f"Extensión no soportada: {extension}")
+        if isinstance(resultado["datos"], pd.DataFrame):
+            resultado["tipo"] = "tabla"
+            resultado["datos"], resultado["tipos"] = optimizar_tipos(resultado["datos"])
+        else:
+            resultado["tipo"] = "texto"
+    except Exception as e:
+        resultado["error"] = f"{type(e).__name__}: {e}"
+    resultado["segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+def _parsear_json(contenido):
+    datos = json.loads(contenido)
+    if isinstance(datos, list) and all(isinstance(d, dict) for d in datos):
+        return pd.json_normalize(datos)
+    try:
+        return pd.DataFrame(datos)
+    except ValueError:
+        # JSON que no es tabular (objeto de escalares, valor suelto)
+        return {"tipo": type(datos).__name__, "claves": list(datos) if isinstance(datos, dict) else []}
+
+
+def _resumir_texto(contenido):
+    texto = contenido.decode("utf-8", errors="replace")
+    lineas = texto.splitlines()
+    return {
+        "lineas": len(lineas),
+        "palabras": len(texto.split()),
+        "caracteres": len(texto),
+        "inicio": "\n".join(lineas[:5]),
+    }
+
+
+_lock_pools = threading.Lock()
+
+
+# Pools persistentes por proceso: no se recrean en cada rerun.
+# Se usa fork donde existe: con spawn cada worker volvería a ejecutar app.py,
+# porque Streamlit registra el script como módulo __main__.
+@st.cache_resource
+def obtener_pools():
+    metodo = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    procesos = ProcessPoolExecutor(
+        max_workers=MAX_WORKERS,
+        mp_context=multiprocessing.get_context(metodo)
+    )
+    hilos = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="parseo")
+    return procesos, hilos
+
+
+# Envía cada archivo al pool que le corresponde y devuelve (clave, resultado)
+# en el orden en que terminan. `archivos` es una lista de (clave, nombre, bytes);
+# la clave identifica cada archivo aunque dos compartan nombre.
+def parsear_en_paralelo(archivos):
+    procesos, hilos = obtener_pools()
+    futuros = {}
+    for clave, nombre, contenido in archivos:
+        extension = nombre.rsplit(".", 1)[-1].lower()
+        pool = procesos if extension in EXTENSIONES_CPU else hilos
+        futuros[pool.submit(parsear_archivo, nombre, contenido)] = (clave, nombre, contenido)
+    for futuro in as_completed(futuros):
+        clave, nombre, contenido = futuros[futuro]
+        try:
+            yield clave, futuro.result()
+        except BrokenProcessPool:
+            # Un worker murió (sin memoria o un archivo malicioso): el archivo
+            # no se reintenta en el proceso del servidor, se informa como error
+            _descartar_pool(procesos)
+            yield clave, {
+                "nombre": nombre, "tipo": None, "datos": None, "segundos": 0.0,
+                "error": "El proceso worker terminó de forma inesperada al parsear este archivo",
+            }
+
+
+# Descarta el pool de procesos roto, solo si sigue siendo el de la caché: otra
+# sesión puede haberlo sustituido ya por uno nuevo que no hay que tirar
+def _descartar_pool(roto):
+    with _lock_pools:
+        if obtener_pools()[0] is roto:
+            obtener_pools.clear()
+    roto.shutdown(wait=False, cancel_futures=True)
+
+
+# Tabla de tiempos y errores por archivo
+def reporte(resultados):
+    return pd.DataFrame([{
+        "archivo": r["nombre"],
+        "tipo": r["tipo"] or "-",
+        "segundos": round(r["segundos"], 3),
+        "MB en memoria": round(sum(t["bytes_despues"] for t in r["tipos"]) / 1024 / 1024, 2) if "tipos" in r else None,
+        "MB sin optimizar": round(sum(t["bytes_antes"] for t in r["tipos"]) / 1024 / 1024, 2) if "tipos" in r else None,
+        "error": r["error"] or "",
+    } for r in resultados])
@@ -0,0 +1,172 @@
+import streamlit as st
+import atexit
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+
+# Base SQLite (modo WAL) donde se guardan los registros del formulario
+RUTA_DB = os.environ.get(
+    "ST_APP_REGISTROS_DB",
+    os.path.join(os.path.expanduser("~"), ".cache", "st-app", "registros.sqlite3")
+)
+# El buffer se vuelca al llegar a TAMANO_LOTE registros o cada INTERVALO_VOLCADO segundos
+TAMANO_LOTE = 200
+INTERVALO_VOLCADO = 1.0
+# Registros pendientes admitidos antes de frenar a quien envía, y segundos que
+# se espera a que haya hueco antes de rechazar el envío
+MAX_PENDIENTES = 10_000
+ESPERA_MAXIMA = 5.0
+
+PAISES = ["México", "España", "Argentina", "Colombia"]
+PROFESIONES = ["Estudiante", "Empleado", "Independiente", "Jubilado"]
+DISPONIBILIDADES = ["Tiempo completo", "Medio tiempo", "Por proyectos"]
+
+
+class BufferLleno(Exception):
+    pass
+
+
+# Definición de un campo del esquema
+class Campo:
+    def __init__(self, tipo, obligatorio=False, minimo=None, maximo=None, opciones=None,
+                 patron=None, max_longitud=None):
+        self.tipo = tipo
+        self.obligatorio = obligatorio
+        self.minimo = minimo
+        self.maximo = maximo
+        self.opciones = opciones
+        self.patron = re.compile(patron) if patron else None
+        self.max_longitud = max_longitud
+
+    def validar(self, nombre, valor):
+        if valor is None or valor == "" or (self.tipo is bool and self.obligatorio and not valor):
+            return [f"{nombre}: campo obligatorio"] if self.obligatorio else []
+        if not isinstance(valor, self.tipo) or (self.tipo is int and isinstance(valor, bool)):
+            return [f"{nombre}: se esperaba {self.tipo.__name__}"]
+        errores = []
+        if self.minimo is not None and valor < self.minimo:
+            errores.append(f"{nombre}: mínimo {self.minimo}")
+        if self.maximo is not None and valor > self.maximo:
+            errores.append(f"{nombre}: máximo {self.maximo}")
+        if self.opciones is not None and valor not in self.opciones:
+            errores.append(f"{nombre}: valor no permitido")
+        if self.patron is not None and not self.patron.fullmatch(valor):
+            errores.append(f"{nombre}: formato inválido")
+        if self.max_longitud is not None and len(valor) > self.max_longitud:
+            errores.append(f"{nombre}: máximo {self.max_longitud} caracteres")
+        return errores
+
+
+ESQUEMA_REGISTRO = {
+    "nombre": Campo(str, obligatorio=True, max_longitud=200),
+    "email": Campo(str, obligatorio=True, patron=r"[^@\s]+@[^@\s]+\.[^@\s]+", max_longitud=254),
+    "telefono": Campo(str, patron=r"[0-9 +()-]{6,20}"),
+    "edad": Campo(int, obligatorio=True, minimo=18, maximo=100),
+    "pais": Campo(str, obligatorio=True, opciones=PAISES),
+    "profesion": Campo(str, obligatorio=True, opciones=PROFESIONES),
+    "experiencia": Campo(int, minimo=0, maximo=30),
+    "disponibilidad": Campo(str, opciones=DISPONIBILIDADES),
+    "comentarios": Campo(str, max_longitud=5_000),
+    "acepta": Campo(bool, obligatorio=True),
+}
+
+_TIPOS_SQL = {str: "TEXT", int: "INTEGER", float: "REAL", bool: "INTEGER"}
+
+
+# Lista de errores (vacía si los datos cumplen el esquema)
+def validar(datos, esquema=ESQUEMA_REGISTRO):
+    errores = [f"{nombre}: campo desconocido" for nombre in datos if nombre not in esquema]
+    for nombre, campo in esquema.items():
+        errores.extend(campo.validar(nombre, datos.get(nombre)))
+    return errores
+
+
+# Buffer de escritura diferida: las sesiones encolan y un hilo vuelca por
+# lotes con una sola transacción, en lugar de una escritura por clic
+class EscritorDiferido:
+    def __init__(self, ruta, esquema, tabla="registros"):
+        self.ruta = ruta
+        self.tabla = tabla
+        self.columnas = list(esquema)
+        self.escritos = 0
+        self._cola = queue.Queue(maxsize=MAX_PENDIENTES)
+        self._lote_listo = threading.Event()
+        self._volcado = threading.Lock()
+        # Lote que falló al escribirse (p. ej. base bloqueada): se reintenta
+        self._reintento = []
+
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with self._conectar() as conexion:
+            definiciones = ", ".join(f"{c} {_TIPOS_SQL[esquema[c].tipo]}" for c in self.columnas)
+            conexion.execute(
+                f"CREATE TABLE IF NOT EXISTS {tabla} (id INTEGER PRIMARY KEY, recibido REAL NOT NULL, {definiciones})"
+            )
+        self._hilo = threading.Thread(target=self._bucle, name="escritor-registros", daemon=True)
+        self._hilo.start()
+        atexit.register(self.volcar)
+
+    def _conectar(self):
+        conexion = sqlite3.connect(self.ruta, timeout=30)
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")
+        return conexion
+
+    # Encola un registro ya validado. Si hay demasiados pendientes (p. ej. la
+    # base lleva un rato fallando) espera hasta ESPERA_MAXIMA y luego lanza
+    # BufferLleno, en lugar de bloquear el script para siempre.
+    def encolar(self, datos):
+        try:
+            self._cola.put((time.time(), *(datos.get(c) for c in self.columnas)), timeout=ESPERA_MAXIMA)
+        except queue.Full:
+            raise BufferLleno("Hay demasiados registros pendientes de guardar; inténtalo más tarde")
+        if self._cola.qsize() >= TAMANO_LOTE:
+            self._lote_listo.set()
+
+    @property
+    def pendientes(self):
+        return self._cola.qsize()
+
+    def _bucle(self):
+        while True:
+            self._lote_listo.wait(INTERVALO_VOLCADO)
+            self._lote_listo.clear()
+            try:
+                self.volcar()
+            except sqlite3.Error:
+                pass
+
+    # Escribe todo lo pendiente, en lotes de TAMANO_LOTE
+    def volcar(self):
+        with self._volcado:
+            while True:
+                lote, self._reintento = self._reintento, []
+                while len(lote) < TAMANO_LOTE:
+                    try:
+                        lote.append(self._cola.get_nowait())
+                    except queue.Empty:
+                        break
+                if not lote:
+                    return
+                marcas = ", ".join("?" * (len(self.columnas) + 1))
+                try:
+                    conexion = self._conectar()
+                    try:
+                        with conexion:
+                            conexion.executemany(
+                                f"INSERT INTO {self.tabla} (recibido, {', '.join(self.columnas)}) VALUES ({marcas})",
+                                lote
+                            )
+                    finally:
+                        conexion.close()
+                except sqlite3.Error:
+                    self._reintento = lote
+                    raise
+                self.escritos += len(lote)
+
+
+@st.cache_resource
+def obtener_escritor():
+    return EscritorDiferido(RUTA_DB, ESQUEMA_REGISTRO)
@@ -0,0 +1,80 @@
+import pandas as pd
+import numpy as np
+
+# Filas por chunk: acota la memoria usada al recorrer CSVs grandes
+TAMANO_CHUNK = 100_000
+
+
+# Estadísticas por columna acumuladas chunk a chunk, en una sola pasada
+class ResumenCSV:
+    def __init__(self):
+        self.filas = 0
+        self.dtypes = {}
+        self.nulos = {}
+        self.minimos = {}
+        self.maximos = {}
+
+    def actualizar(self, chunk):
+        self.filas += len(chunk)
+        nulos_chunk = chunk.isna().sum()
+        for col in chunk.columns:
+            serie = chunk[col]
+            self.dtypes[col] = _combinar_dtypes(self.dtypes.get(col), serie.dtype)
+            self.nulos[col] = self.nulos.get(col, 0) + int(nulos_chunk[col])
+
+            validos = serie.dropna()
+            if validos.empty:
+                continue
+            try:
+                minimo, maximo = validos.min(), validos.max()
+            except TypeError:
+                # Columnas con tipos mezclados: sin min/max
+                continue
+            self._acumular(col, minimo, maximo)
+
+    def _acumular(self, col, minimo, maximo):
+        try:
+            if col not in self.minimos or minimo < self.minimos[col]:
+                self.minimos[col] = minimo
+            if col not in self.maximos or maximo > self.maximos[col]:
+                self.maximos[col] = maximo
+        except TypeError:
+            # El tipo de la columna cambió entre chunks (p. ej. número -> texto)
+            self.minimos.pop(col, None)
+            self.maximos.pop(col, None)
+
+    # Tabla final con una fila por columna del CSV.
+    # Mínimo y máximo van como texto: mezclan tipos entre columnas y Arrow
+    # no puede serializar una columna object con números y cadenas.
+    def tabla(self):
+        return pd.DataFrame({
+            "dtype": [str(t) for t in self.dtypes.values()],
+            "nulos": list(self.nulos.values()),
+            "mínimo": [_texto(self.minimos.get(c)) for c in self.dtypes],
+            "máximo": [_texto(self.maximos.get(c)) for c in self.dtypes],
+        }, index=list(self.dtypes))
+
+
+def _texto(valor):
+    return None if valor is None else str(valor)
+
+
+# dtype común de una columna vista en varios chunks
+def _combinar_dtypes(anterior, nuevo):
+    if anterior is None or anterior == nuevo:
+        return nuevo
+    if pd.api.types.is_numeric_dtype(anterior) and pd.api.types.is_numeric_dtype(nuevo):
+        return np.result_type(anterior, nuevo)
+    return np.dtype(object)
+
+
+# Recorre un CSV por chunks sin cargarlo entero en memoria.
+# Devuelve (chunk, resumen) tras cada chunk para poder mostrar la vista
+# previa en cuanto se parsea el primero y el progreso del conteo de filas.
+def leer_por_chunks(archivo, tamano_chunk=TAMANO_CHUNK):
+    if hasattr(archivo, "seek"):
+        archivo.seek(0)
+    resumen = ResumenCSV()
+    for chunk in pd.read_csv(archivo, chunksize=tamano_chunk):
+        resumen.actualizar(chunk)
+        yield chunk, resumen
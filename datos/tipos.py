@@ -0,0 +1,118 @@
+import pandas as pd
+import numpy as np
+import re
+
+from monitoreo import instrumentado
+
+# Cadenas con aspecto de fecha y año de 4 cifras: 2024-01-31, 31/01/2024,
+# 2024.01.31 (con hora o sin ella). Descarta versiones como 1.2.3.
+_PATRON_FECHA = re.compile(r"^\s*(\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{4})([ T]\d{1,2}:\d{2}(:\d{2})?)?\s*$")
+# Formatos que se prueban, en orden: año primero y, si no, día primero (como se
+# escribe en México y España). Nunca mes primero: 05/06/2024 es 5 de junio.
+FORMATOS_FECHA = [
+    f"{fecha}{hora}"
+    for fecha in ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
+    for hora in ("", " %H:%M:%S", " %H:%M", "T%H:%M:%S", "T%H:%M")
+]
+# Filas que se miran para decidir si una columna es de fechas
+MUESTRA_FECHAS = 100
+# Una columna de texto pasa a categoría si en la muestra hay como mucho esta
+# fracción de valores distintos
+MUESTRA_CARDINALIDAD = 10_000
+FRACCION_CATEGORIAS = 0.5
+
+
+def _bytes(serie):
+    return int(serie.memory_usage(deep=True, index=False))
+
+
+# Enteros al tipo más pequeño que los contiene (sin signo si no hay negativos)
+def _reducir_entero(serie):
+    return pd.to_numeric(serie, downcast="unsigned" if serie.min() >= 0 else "integer")
+
+
+# float32 solo si no se pierde nada: todos los valores vuelven idénticos a float64
+def _reducir_flotante(serie):
+    valores = serie.to_numpy()
+    compacto = valores.astype(np.float32)
+    if np.array_equal(compacto.astype(np.float64), valores, equal_nan=True):
+        return serie.astype(np.float32)
+    return serie
+
+
+# Fechas si la muestra tiene forma de fecha y uno de FORMATOS_FECHA parsea la
+# columna entera sin perder valores; si ninguno lo hace se deja como texto
+def _como_fecha(serie):
+    muestra = serie.dropna().head(MUESTRA_FECHAS).astype(str)
+    if muestra.empty or not muestra.str.match(_PATRON_FECHA).all():
+        return None
+    nulos = serie.isna().sum()
+    for formato in FORMATOS_FECHA:
+        # Descarte rápido con la muestra antes de parsear toda la columna
+        if pd.to_datetime(muestra, format=formato, errors="coerce").isna().any():
+            continue
+        fechas = pd.to_datetime(serie, format=formato, errors="coerce")
+        if fechas.isna().sum() == nulos:
+            return fechas
+    return None
+
+
+# Columnas de texto: cadenas de pandas u object cuyos valores (sin nulos) son
+# todos str; las mezclas de tipos se dejan como están
+def _es_texto(serie):
+    if isinstance(serie.dtype, pd.StringDtype):
+        return True
+    return pd.api.types.is_object_dtype(serie) and pd.api.types.infer_dtype(serie, skipna=True) == "string"
+
+
+# Texto como categoría o como cadena Arrow, la que ocupe menos. Con muchos
+# valores distintos (según una muestra) la categoría no compensa y ni se prueba.
+# Con pandas 3 el texto ya llega como cadena Arrow y se deja igual.
+def _reducir_texto(serie):
+    arrow = serie.astype("string[pyarrow]") if pd.api.types.is_object_dtype(serie) else serie
+    muestra = serie.head(MUESTRA_CARDINALIDAD)
+    if muestra.nunique() > len(muestra) * FRACCION_CATEGORIAS:
+        return arrow
+    return min([serie.astype("category"), arrow], key=_bytes)
+
+
+# Devuelve una copia del DataFrame con tipos compactos y el reporte por
+# columna: [{"columna", "antes", "despues", "bytes_antes", "bytes_despues"}].
+# Enteros y flotantes se reducen sin pérdida, las fechas se parsean y el
+# texto pasa a categoría (pocos valores distintos) o a cadenas Arrow.
+@instrumentado("optimizar_tipos")
+def optimizar_tipos(df):
+    optimizado = df.copy(deep=False)
+    reporte = []
+    for i, col in enumerate(df.columns):
+        serie = df.iloc[:, i]
+        nueva = serie
+        if pd.api.types.is_bool_dtype(serie):
+            pass
+        elif pd.api.types.is_integer_dtype(serie) and not isinstance(serie.dtype, pd.api.extensions.ExtensionDtype):
+            nueva = _reducir_entero(serie)
+        elif pd.api.types.is_float_dtype(serie) and serie.dtype == np.float64:
+            nueva = _reducir_flotante(serie)
+        elif _es_texto(serie):
+            fechas = _como_fecha(serie)
+            nueva = fechas if fechas is not None else _reducir_texto(serie)
+        optimizado.isetitem(i, nueva)
+        reporte.append({
+            "columna": str(col),
+            "antes": str(serie.dtype),
+            "despues": str(nueva.dtype),
+            "bytes_antes": _bytes(serie),
+            "bytes_despues": _bytes(nueva),
+        })
+    return optimizado, reporte
+
+
+# Reporte legible: tipos, tamaños en KB y factor de reducción por columna
+def tabla_reporte(reporte):
+    tabla = pd.DataFrame(reporte)
+    if tabla.empty:
+        return tabla
+    tabla["KB antes"] = tabla.pop("bytes_antes") / 1024
+    tabla["KB después"] = tabla.pop("bytes_despues") / 1024
+    tabla["reducción"] = (tabla["KB antes"] / tabla["KB después"].where(tabla["KB después"] > 0)).round(1)
+    return tabla
@@ -0,0 +1 @@
+# Construcción de figuras (importa plotly) y gráficos en vivo para la sección de gráficos
@@ -0,0 +1,87 @@
+import numpy as np
+import plotly.graph_objects as go
+import hashlib
+
+from cache_compartida import espacio
+from datos.muestreo import reducir
+from monitoreo import medir
+from sesion.memoria import tamano
+
+# A partir de cuántos puntos el modo "Auto" cambia a WebGL
+UMBRAL_WEBGL = 10_000
+# Figuras guardadas en la caché de figuras
+MAX_FIGURAS = 32
+MODOS_RENDER = ["Auto", "SVG", "WebGL"]
+
+
+# Huella de los datos de entrada y de los parámetros de la figura
+def huella(*arrays, **parametros):
+    h = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        h.update(str((array.dtype, array.shape)).encode())
+        h.update(array.data)
+    h.update(repr(sorted(parametros.items())).encode())
+    return h.hexdigest()
+
+
+# Arrays numéricos compactos: plotly los envía como buffers binarios tipados
+# (base64 + dtype) en lugar de listas JSON, y float32/int32 ocupan la mitad
+def _compactar(valores):
+    array = np.asarray(valores)
+    if np.issubdtype(array.dtype, np.integer) and len(array) and array.min() >= -2**31 and array.max() < 2**31:
+        return array.astype(np.int32)
+    if np.issubdtype(array.dtype, np.floating):
+        return array.astype(np.float32)
+    return array
+
+
+# Bytes de una figura: los arrays de sus trazas (el resto es despreciable)
+def _tamano_figura(valor):
+    if not isinstance(valor, go.Figure):
+        return tamano(valor)
+    return sum(
+        np.asarray(traza[eje]).nbytes
+        for traza in valor.data for eje in ("x", "y")
+        if traza[eje] is not None
+    )
+
+
+# Figuras y datos reducidos por huella, en la caché compartida entre sesiones
+def obtener_cache_figuras():
+    return espacio("figuras", max_entradas=MAX_FIGURAS, medir=_tamano_figura)
+
+
+# Gráfico de dispersión: Scattergl para series grandes (o si se fuerza),
+# arrays binarios y reutilización de la figura si los datos no cambiaron.
+# La figura devuelta es compartida: no debe modificarse.
+def figura_dispersion(x, y, titulo, modo="Auto"):
+    x, y = _compactar(x), _compactar(y)
+    webgl = modo == "WebGL" or (modo == "Auto" and len(y) > UMBRAL_WEBGL)
+    clave = huella(x, y, titulo=titulo, webgl=webgl)
+
+    cache = obtener_cache_figuras()
+    figura = cache.get(clave)
+    if figura is None:
+        with medir("figura_dispersion", "figura"):
+            traza = go.Scattergl if webgl else go.Scatter
+            figura = go.Figure(traza(x=x, y=y, mode="markers"))
+            figura.update_layout(title=titulo, xaxis_title="x", yaxis_title="y")
+        cache.put(clave, figura)
+    return figura
+
+
+# Datos reducidos para st.line_chart/st.bar_chart, reutilizados mientras no
+# cambien los datos ni el muestreo. `clave` identifica los datos cuando ya se
+# conocen (p. ej. las series demo, deterministas); si no, se usa su huella.
+def datos_grafico(df, n_puntos, metodo, clave=None):
+    if clave is None:
+        clave = huella(df.index.to_numpy(), df.to_numpy())
+    clave = huella(clave=clave, n_puntos=n_puntos, metodo=metodo, tipo="datos")
+
+    cache = obtener_cache_figuras()
+    vista = cache.get(clave)
+    if vista is None:
+        vista = reducir(df, n_puntos, metodo)
+        cache.put(clave, vista)
+    return vista
@@ -0,0 +1,55 @@
+import pandas as pd
+import numpy as np
+
+from cache_compartida import cacheado
+from monitoreo import instrumentado
+
+# Niveles de zoom precalculados (escala de st.map / Mapbox)
+NIVELES_ZOOM = [6, 8, 10, 12, 14, 16]
+# Por debajo de este número de filas se envían los puntos sin agregar
+UMBRAL_AGREGACION = 5_000
+_METROS_POR_GRADO = 111_320
+
+
+# Lado de la celda en grados: ~1/8 del ancho de una tesela a ese zoom
+def tamano_celda(zoom):
+    return 360 / 2 ** zoom / 8
+
+
+# Agrupa los puntos en una rejilla regular: una fila por celda ocupada con
+# el centroide de sus puntos, el conteo y un radio en metros para st.map
+def agregar_en_rejilla(lat, lon, zoom):
+    celda = tamano_celda(zoom)
+    fila = np.floor(lat / celda).astype(np.int64)
+    columna = np.floor(lon / celda).astype(np.int64)
+    claves, inversa, conteos = np.unique(
+        fila * (2 ** 32) + columna, return_inverse=True, return_counts=True
+    )
+    agregados = pd.DataFrame({
+        "lat": np.bincount(inversa, weights=lat) / conteos,
+        "lon": np.bincount(inversa, weights=lon) / conteos,
+        "puntos": conteos,
+    })
+    # Círculos que crecen con la raíz del conteo y no superan media celda
+    agregados["radio"] = celda * _METROS_POR_GRADO / 2 * np.sqrt(conteos / conteos.max())
+    return agregados
+
+
+# Pirámide de agregados para todos los niveles de zoom, calculada una vez por
+# dataset (clave = huella de los datos) y compartida entre sesiones
+@cacheado("mapas", max_entradas=8)
+@instrumentado("piramide_mapa")
+def construir_piramide(clave, _lat, _lon):
+    return {zoom: agregar_en_rejilla(_lat, _lon, zoom) for zoom in NIVELES_ZOOM}
+
+
+# Celdas dentro de la vista actual (centro + extensión aproximada del zoom)
+def celdas_visibles(piramide, zoom, centro_lat, centro_lon):
+    agregados = piramide[zoom]
+    medio_ancho = 360 / 2 ** zoom
+    medio_alto = medio_ancho / 2
+    dentro = (
+        agregados["lat"].between(centro_lat - medio_alto, centro_lat + medio_alto)
+        & agregados["lon"].between(centro_lon - medio_ancho, centro_lon + medio_ancho)
+    )
+    return agregados[dentro]
@@ -0,0 +1,47 @@
+import time
+
+from monitoreo import medir
+
+
+# Gráfico de línea que se actualiza redibujando solo una ventana acotada con
+# los `max_filas` puntos más recientes: el coste de cada actualización no
+# crece con el historial. (Esta versión de Streamlit ya no tiene add_rows(),
+# así que no hay forma de enviar solo los puntos nuevos a un gráfico existente.)
+class GraficoVentana:
+    def __init__(self, contenedor, max_filas):
+        self.contenedor = contenedor
+        self.max_filas = max_filas
+        self.puntos_enviados = 0
+        # Lo que se habría enviado reenviando todo el historial en cada actualización
+        self.puntos_historial = 0
+        self.redibujados = 0
+
+    def dibujar(self, df):
+        with medir("st.line_chart ventana", "st"):
+            self.contenedor.line_chart(df)
+        self.puntos_enviados += len(df)
+        self.redibujados += 1
+
+
+# Mantiene un gráfico al día con una fuente de datos/fuentes.py durante
+# `segundos`, a como mucho `fps` actualizaciones por segundo. Bloquea el
+# script (conviene llamarlo dentro de un fragmento); un rerun lo interrumpe.
+# Devuelve el gráfico para consultar cuántos puntos se enviaron.
+def transmitir(fuente, contenedor, segundos, fps, max_filas):
+    grafico = GraficoVentana(contenedor, max_filas)
+    ventana, posicion = fuente.ultimas(max_filas)
+    grafico.dibujar(ventana)
+    grafico.puntos_historial += posicion
+
+    fin = time.monotonic() + segundos
+    while time.monotonic() < fin:
+        time.sleep(1 / fps)
+        ventana, total = fuente.ultimas(max_filas)
+        # Sin puntos nuevos no se redibuja
+        if total > posicion:
+            grafico.dibujar(ventana)
+            posicion = total
+            grafico.puntos_historial += total
+        if getattr(fuente, "terminada", False):
+            break
+    return grafico
@@ -0,0 +1,151 @@
+import streamlit as st
+import contextlib
+import functools
+import math
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+
+# Perfilado opcional: variable de entorno ST_APP_PERFILADO=1 o ?perfil=1 en la URL
+PERFILADO = os.environ.get("ST_APP_PERFILADO", "") not in ("", "0")
+# Archivo en formato de texto de Prometheus (p. ej. para el textfile collector)
+ARCHIVO_METRICAS = os.environ.get(
+    "ST_APP_METRICAS",
+    os.path.join(tempfile.gettempdir(), "st-app-metricas.prom")
+)
+LIMITES_SEGUNDOS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, math.inf)
+MUESTRAS_RECIENTES = 200
+
+# Tiempos del rerun en curso (Streamlit ejecuta cada rerun en su propio hilo)
+_rerun = threading.local()
+
+
+def activo():
+    if PERFILADO:
+        return True
+    try:
+        return st.query_params.get("perfil") == "1"
+    except Exception:
+        # Fuera de un rerun (hilos de workers, scripts sueltos)
+        return False
+
+
+# Histograma por (nombre, categoria), acumulado para todo el proceso
+class Metricas:
+    def __init__(self):
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observar(self, nombre, categoria, segundos):
+        with self._lock:
+            serie = self._series.setdefault((nombre, categoria), {
+                "conteo": 0,
+                "suma": 0.0,
+                "buckets": [0] * len(LIMITES_SEGUNDOS),
+                "recientes": deque(maxlen=MUESTRAS_RECIENTES),
+            })
+            serie["conteo"] += 1
+            serie["suma"] += segundos
+            serie["recientes"].append(segundos)
+            for i, limite in enumerate(LIMITES_SEGUNDOS):
+                if segundos <= limite:
+                    serie["buckets"][i] += 1
+
+    # Percentil de las muestras recientes de una serie, en segundos
+    def percentil(self, nombre, categoria, q):
+        with self._lock:
+            muestras = sorted(self._series.get((nombre, categoria), {}).get("recientes", ()))
+        if not muestras:
+            return None
+        return muestras[min(len(muestras) - 1, int(q * len(muestras)))]
+
+    def prometheus(self):
+        lineas = [
+            "# HELP st_app_duracion_segundos Duración de secciones, grupos de st.* y operaciones de datos",
+            "# TYPE st_app_duracion_segundos histogram",
+        ]
+        with self._lock:
+            for (nombre, categoria), serie in sorted(self._series.items()):
+                etiquetas = f'nombre="{_escapar(nombre)}",categoria="{_escapar(categoria)}"'
+                for limite, conteo in zip(LIMITES_SEGUNDOS, serie["buckets"]):
+                    le = "+Inf" if limite == math.inf else repr(limite)
+                    lineas.append(f'st_app_duracion_segundos_bucket{{{etiquetas},le="{le}"}} {conteo}')
+                lineas.append(f"st_app_duracion_segundos_sum{{{etiquetas}}} {serie['suma']}")
+                lineas.append(f"st_app_duracion_segundos_count{{{etiquetas}}} {serie['conteo']}")
+        return "\n".join(lineas) + "\n"
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@st.cache_resource
+def obtener_metricas():
+    return Metricas()
+
+
+# Mide un bloque y lo anota en el rerun en curso. Sin perfilado no hace nada.
+@contextlib.contextmanager
+def medir(nombre, categoria="datos"):
+    tiempos = getattr(_rerun, "tiempos", None)
+    if tiempos is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        tiempos.append((nombre, categoria, time.perf_counter() - inicio))
+
+
+# Versión decorador de medir() para operaciones de datos y figuras
+def instrumentado(nombre, categoria="datos"):
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with medir(nombre, categoria):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def iniciar_rerun():
+    _rerun.tiempos = [] if activo() else None
+    _rerun.inicio = time.perf_counter()
+
+
+# Cierra el rerun: acumula sus tiempos, reescribe el archivo de métricas y
+# devuelve la lista [(nombre, categoria, segundos), ...] (None sin perfilado)
+def finalizar_rerun():
+    tiempos = getattr(_rerun, "tiempos", None)
+    _rerun.tiempos = None
+    if tiempos is None:
+        return None
+    tiempos.append(("rerun", "total", time.perf_counter() - _rerun.inicio))
+
+    metricas = obtener_metricas()
+    for nombre, categoria, segundos in tiempos:
+        metricas.observar(nombre, categoria, segundos)
+    # Temporal único por escritura: varios reruns pueden terminar a la vez
+    temporal = f"{ARCHIVO_METRICAS}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(temporal, "w", encoding="utf-8") as f:
+            f.write(metricas.prometheus())
+        os.replace(temporal, ARCHIVO_METRICAS)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temporal)
+    return tiempos
+
+
+# Panel compacto para la barra lateral: este rerun y p50 del proceso
+def mostrar_panel(tiempos):
+    metricas = obtener_metricas()
+    with st.sidebar.expander("⏱️ Tiempos del rerun"):
+        for nombre, categoria, segundos in sorted(tiempos, key=lambda t: -t[2]):
+            p50 = metricas.percentil(nombre, categoria, 0.5)
+            st.caption(f"`{categoria}` {nombre}: **{segundos * 1000:.1f} ms** (p50 {p50 * 1000:.1f} ms)")
+        st.caption(f"Métricas Prometheus: `{ARCHIVO_METRICAS}`")
@@ -0,0 +1 @@
+# Páginas de la guía: un módulo por sección con una función render()
@@ -0,0 +1,260 @@
+import streamlit as st
+import time
+
+from datos import columnar
+from datos.consultas import obtener_motor, FUNCIONES_AGREGACION
+from datos.ingesta import leer_csv, leer_reciente, hash_archivo, reporte_tipos
+from datos.streaming import leer_por_chunks
+from datos.tipos import tabla_reporte
+from datos.multiples import parsear_en_paralelo, reporte
+from monitoreo import medir
+from secciones.comun import show_code
+from secciones.visor import mostrar_tabla, mostrar_descarga
+from sesion.memoria import Derramable
+
+# Máximo de valores distintos para ofrecer el filtro por lista
+MAX_CATEGORIAS = 1_000
+
+
+# Vista previa y estadísticas de un CSV leído por chunks.
+# El resumen se guarda en la sesión para no recorrer el archivo en cada rerun.
+def mostrar_resumen_streaming(uploaded_file):
+    clave = hash_archivo(uploaded_file)
+    guardado = st.session_state.get("resumen_streaming")
+
+    if guardado and guardado[0] == clave:
+        _, preview, filas, tabla = guardado
+        st.dataframe(preview)
+    else:
+        zona_preview = st.empty()
+        progreso = st.empty()
+        preview = None
+        with medir("read_csv por chunks"):
+            for chunk, resumen in leer_por_chunks(uploaded_file):
+                if preview is None:
+                    preview = chunk.head()
+                    zona_preview.dataframe(preview)
+                progreso.text(f"Filas leídas: {resumen.filas:,}")
+        progreso.empty()
+        if preview is None:
+            st.warning("El archivo no contiene filas")
+            return
+        filas, tabla = resumen.filas, resumen.tabla()
+        st.session_state.resumen_streaming = (clave, preview, filas, tabla)
+
+    st.success(f"Archivo leído por partes: {filas} filas, {len(tabla)} columnas")
+    st.dataframe(tabla)
+
+
+# Parsea los archivos subidos en paralelo y muestra cada uno al terminar.
+# Los resultados se guardan en la sesión por (nombre, hash) para no
+# volver a parsear en cada rerun.
+def mostrar_archivos_multiples(multi_files):
+    parseados = st.session_state.setdefault("archivos_parseados", {})
+    claves = {(f.name, hash_archivo(f)): f for f in multi_files}
+    pendientes = [(clave, f) for clave, f in claves.items() if clave not in parseados]
+
+    if pendientes:
+        progreso = st.progress(0)
+        archivos = [(clave, f.name, f.getvalue()) for clave, f in pendientes]
+        with medir("parseo paralelo"):
+            for i, (clave, resultado) in enumerate(parsear_en_paralelo(archivos), 1):
+                # Los DataFrames pueden derramarse a disco si la memoria aprieta
+                if resultado["tipo"] == "tabla":
+                    resultado["datos"] = Derramable(resultado["datos"])
+                parseados[clave] = resultado
+                progreso.progress(i / len(pendientes), text=f"Parseado: {resultado['nombre']}")
+        progreso.empty()
+
+    # Olvidar archivos que ya no están en el uploader
+    for clave in list(parseados):
+        if clave not in claves:
+            del parseados[clave]
+
+    resultados = [parseados[clave] for clave in claves]
+    for (nombre, hash_), resultado in zip(claves, resultados):
+        with st.expander(f"{resultado['nombre']} ({resultado['segundos']:.3f} s)"):
+            if resultado["error"]:
+                st.error(resultado["error"])
+            elif resultado["tipo"] == "tabla":
+                # Nombre y hash: dos archivos iguales con distinto nombre no
+                # deben compartir las claves de sus widgets
+                mostrar_tabla(resultado["datos"].valor, f"multiple-{nombre}-{hash_}")
+            else:
+                st.json(resultado["datos"])
+
+    st.markdown("**Reporte de parseo:**")
+    st.dataframe(reporte(resultados), use_container_width=True)
+
+
+# Hashes de los CSV subidos en esta sesión, con el nombre con que se subieron.
+# La caché en disco es común a todos, pero la lista de recientes solo muestra
+# lo que subió cada sesión.
+def registrar_subida(clave, nombre):
+    subidos = st.session_state.setdefault("datasets_subidos", {})
+    subidos.pop(clave, None)
+    subidos[clave] = nombre
+
+
+# Recientes de la caché columnar limitados a esta sesión (el más nuevo primero),
+# con el nombre de archivo que usó esta sesión: [(clave, meta), ...]
+def recientes_sesion():
+    subidos = st.session_state.get("datasets_subidos", {})
+    return [
+        (clave, {**meta, "nombre": subidos[clave]})
+        for clave, meta in columnar.recientes() if clave in subidos
+    ]
+
+
+# Tipos elegidos al cargar el CSV y memoria ahorrada por columna
+def mostrar_tipos(clave):
+    reporte = reporte_tipos(clave)
+    if not reporte:
+        return
+    antes = sum(t["bytes_antes"] for t in reporte)
+    despues = sum(t["bytes_despues"] for t in reporte)
+    with st.expander(f"🧮 Tipos y memoria: {despues / 1024 / 1024:.1f} MB (sin optimizar {antes / 1024 / 1024:.1f} MB)"):
+        st.dataframe(tabla_reporte(reporte), use_container_width=True)
+
+
+# Filtros y agregación sobre el CSV subido, resueltos con los índices del
+# motor de consultas (se construyen una vez por dataset). El resultado se
+# muestra en el visor paginado, que también se encarga del orden, y se puede
+# descargar tal como se ve.
+def mostrar_explorador(df, clave, nombre):
+    st.markdown("**Filtrar, ordenar y agrupar:**")
+    motor = obtener_motor(clave, df)
+    categoricas = motor.columnas_categoricas()
+    numericas = motor.columnas_numericas()
+    filtros = []
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if categoricas:
+            col_categoria = st.selectbox("Filtrar por categoría:", categoricas)
+            categorias = motor.categorias(col_categoria)
+            if len(categorias) > MAX_CATEGORIAS:
+                st.caption(f"{len(categorias):,} valores distintos: demasiados para filtrar por lista")
+            else:
+                valores = st.multiselect("Valores:", categorias)
+                if valores:
+                    filtros.append(("categoria", col_categoria, valores))
+
+    with col2:
+        if numericas:
+            col_rango = st.selectbox("Filtrar por rango:", numericas)
+            minimo, maximo = motor.rango(col_rango)
+            if minimo < maximo:
+                rango = st.slider("Rango:", minimo, maximo, (minimo, maximo))
+                if rango != (minimo, maximo):
+                    filtros.append(("rango", col_rango, rango))
+
+    inicio = time.perf_counter()
+    filas = motor.filtrar(filtros)
+    duracion = (time.perf_counter() - inicio) * 1000
+    st.caption(f"{len(filas):,} de {len(df):,} filas · filtro en {duracion:.1f} ms")
+
+    filas = mostrar_tabla(df, clave, filas)
+    mostrar_descarga(df, clave, nombre, filas)
+
+    if categoricas and numericas:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            por = st.selectbox("Agrupar por:", categoricas)
+        with col2:
+            columna = st.selectbox("Agregar columna:", numericas)
+        with col3:
+            funcion = st.selectbox("Función:", FUNCIONES_AGREGACION)
+        st.dataframe(motor.agrupar(filas, por, columna, funcion), use_container_width=True)
+
+
+# SECCIÓN: Carga de Archivos
+def render():
+    st.header("📁 Carga y Manejo de Archivos")
+
+    st.subheader("1. st.file_uploader()")
+
+    col1, col2 = st.columns(2)
+    df = None
+    clave = None
+
+    with col1:
+        st.markdown("**Ejemplo:**")
+        uploaded_file = st.file_uploader(
+            "Sube un archivo CSV",
+            type=['csv'],
+            help="Solo archivos CSV permitidos"
+        )
+
+        modo_streaming = st.checkbox(
+            "Modo streaming (archivos grandes)",
+            help="Lee el CSV por partes: muestra la vista previa y las estadísticas sin cargarlo entero en memoria"
+        )
+
+        if uploaded_file is not None:
+            try:
+                if modo_streaming:
+                    mostrar_resumen_streaming(uploaded_file)
+                else:
+                    clave = hash_archivo(uploaded_file)
+                    df = leer_csv(uploaded_file, clave)
+                    st.success(f"Archivo cargado: {df.shape[0]} filas, {df.shape[1]} columnas")
+            except Exception as e:
+                st.error(f"Error al leer archivo: {e}")
+
+    with col2:
+        show_code("""
+uploaded_file = st.file_uploader(
+    "Sube un archivo CSV",
+    type=['csv'],
+    help="Solo archivos CSV permitidos"
+)
+
+if uploaded_file is not None:
+    df = pd.read_csv(uploaded_file)
+    st.dataframe(df.head())
+        """)
+
+    if df is not None:
+        registrar_subida(clave, uploaded_file.name)
+        mostrar_tipos(clave)
+        mostrar_explorador(df, clave, uploaded_file.name)
+
+    # Ejemplo con múltiples tipos
+    st.subheader("2. Múltiples tipos de archivo")
+
+    multi_files = st.file_uploader(
+        "Sube múltiples archivos",
+        type=['csv', 'xlsx', 'txt', 'json'],
+        accept_multiple_files=True
+    )
+
+    if multi_files:
+        st.write(f"Archivos subidos: {len(multi_files)}")
+        mostrar_archivos_multiples(multi_files)
+
+    # Datasets de esta sesión que siguen en la caché columnar
+    st.subheader("3. Datasets recientes")
+
+    recientes = recientes_sesion()
+    if recientes:
+        etiquetas = {
+            clave: f"{meta['nombre']} ({meta['filas']} filas, {meta['bytes'] / 1024 / 1024:.1f} MB)"
+            for clave, meta in recientes
+        }
+        clave = st.selectbox(
+            "Reabrir dataset:",
+            [None] + list(etiquetas),
+            format_func=lambda c: "—" if c is None else etiquetas[c]
+        )
+        if clave is not None:
+            df_reciente = leer_reciente(clave)
+            if df_reciente is None:
+                st.error("El dataset ya no está disponible en la caché")
+            else:
+                mostrar_tabla(df_reciente, f"reciente-{clave}")
+                mostrar_descarga(df_reciente, f"reciente-{clave}", dict(recientes)[clave]["nombre"])
+                st.success(f"Dataset cargado: {df_reciente.shape[0]} filas, {df_reciente.shape[1]} columnas")
+    else:
+        st.write("Todavía no hay datasets de esta sesión en caché. Sube un CSV para guardarlo.")
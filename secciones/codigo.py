@@ -0,0 +1,79 @@
+import streamlit as st
+import ast
+import functools
+import hashlib
+import os
+import textwrap
+
+DIRECTORIO_SECCIONES = os.path.dirname(os.path.abspath(__file__))
+MAX_RESULTADOS = 10
+
+
+# Texto normalizado de un ejemplo (sin sangría común ni líneas en blanco en
+# los extremos). Se memoriza por cadena: los literales de las secciones son
+# siempre los mismos objetos, así que se calcula una vez.
+@functools.lru_cache(maxsize=256)
+def normalizar(codigo):
+    return textwrap.dedent(codigo).strip("\n").rstrip()
+
+
+# Clave de un ejemplo normalizado en el índice
+def clave_ejemplo(texto):
+    return hashlib.blake2b(texto.encode(), digest_size=8).hexdigest()
+
+
+# Índice de todos los ejemplos de show_code(), leído del código fuente de las
+# secciones (sin importarlas): {hash: {"codigo", "ubicaciones": [(modulo, linea)]}}.
+# Un ejemplo repetido en varias secciones se guarda una sola vez.
+@st.cache_resource(show_spinner=False)
+def indice():
+    ejemplos = {}
+    for archivo in sorted(os.listdir(DIRECTORIO_SECCIONES)):
+        if not archivo.endswith(".py"):
+            continue
+        modulo = f"secciones.{archivo[:-3]}"
+        with open(os.path.join(DIRECTORIO_SECCIONES, archivo), encoding="utf-8") as f:
+            arbol = ast.parse(f.read())
+        for nodo in ast.walk(arbol):
+            if (isinstance(nodo, ast.Call) and getattr(nodo.func, "id", None) == "show_code"
+                    and nodo.args and isinstance(nodo.args[0], ast.Constant)
+                    and isinstance(nodo.args[0].value, str)):
+                texto = normalizar(nodo.args[0].value)
+                clave = clave_ejemplo(texto)
+                ejemplo = ejemplos.setdefault(clave, {"codigo": texto, "ubicaciones": []})
+                ejemplo["ubicaciones"].append((modulo, nodo.lineno))
+    return ejemplos
+
+
+# Ejemplos que contienen todas las palabras buscadas: [(hash, ejemplo), ...]
+def buscar(consulta):
+    palabras = consulta.lower().split()
+    return [
+        (clave, ejemplo) for clave, ejemplo in indice().items()
+        if all(p in ejemplo["codigo"].lower() for p in palabras)
+    ]
+
+
+# Muestra un ejemplo ya normalizado. Como el mensaje es idéntico en cada
+# rerun, el navegador lo tiene en su caché por hash y el servidor solo envía
+# la referencia (ver .streamlit/config.toml). No se graba con cache_resource:
+# dentro de un bloque estatico la reproducción anidada saldría de su columna.
+def mostrar(texto):
+    st.code(texto, language='python')
+
+
+# Buscador de ejemplos de todas las secciones para la barra lateral.
+# `secciones` es el registro de app.py (etiqueta -> módulo).
+def mostrar_buscador(secciones):
+    etiquetas = {modulo: etiqueta for etiqueta, modulo in secciones.items()}
+    with st.sidebar.expander("🔎 Ejemplos de código"):
+        consulta = st.text_input("Buscar:", key="buscar-ejemplos", placeholder="p. ej. st.columns")
+        if not consulta:
+            st.caption(f"{len(indice())} ejemplos indexados")
+            return
+        resultados = buscar(consulta)
+        st.caption(f"{len(resultados)} ejemplos")
+        for _, ejemplo in resultados[:MAX_RESULTADOS]:
+            lugares = sorted({etiquetas.get(modulo, modulo) for modulo, _ in ejemplo["ubicaciones"]})
+            st.markdown(f"**{', '.join(lugares)}**")
+            mostrar(ejemplo["codigo"])
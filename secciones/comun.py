@@ -0,0 +1,26 @@
+import streamlit as st
+import os
+
+from secciones.codigo import normalizar, mostrar
+
+# Pre-renderizado de las partes constantes de las secciones (ver estatico)
+PRERENDER = os.environ.get("ST_APP_PRERENDER", "1") not in ("", "0")
+
+
+# Función para mostrar código. Cada ejemplo se normaliza una vez (ver
+# secciones/codigo.py) y el navegador lo reutiliza de su caché de mensajes
+def show_code(code):
+    mostrar(normalizar(code))
+
+
+# Bloques sin widgets ni datos por usuario: la primera ejecución en el proceso
+# graba los elementos que genera (st.cache_resource guarda sus mensajes ya
+# serializados) y las siguientes, en cualquier sesión, los reproducen sin
+# volver a ejecutar la función. Editar la función invalida la grabación.
+# Las grabaciones no caducan ni se vacían con la caché compartida: lo que se
+# llame dentro debe ser constante. ST_APP_PRERENDER=0 vuelve a ejecutarlos en
+# cada rerun.
+def estatico(funcion):
+    if not PRERENDER:
+        return funcion
+    return st.cache_resource(show_spinner=False)(funcion)
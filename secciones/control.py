@@ -0,0 +1,190 @@
+import streamlit as st
+import time
+
+from datos import columnar
+from datos.ingesta import leer_csv, hash_archivo
+from secciones.comun import show_code, estatico
+from trabajos import cola, fondo
+
+
+# Trabajo de las demos, ejecutado en segundo plano (sin llamadas a st.*)
+def _simular_proceso(reportar):
+    for i in range(101):
+        reportar(i, f'Progreso: {i}%')
+        time.sleep(0.01)
+
+
+def _cargar(reportar):
+    reportar(0, 'Cargando...')
+    time.sleep(2)
+
+
+# Formulario para enviar un trabajo sobre el CSV subido
+def enviar_trabajo(archivo):
+    clave = hash_archivo(archivo)
+    df = leer_csv(archivo, clave)
+    numericas = list(df.select_dtypes("number").columns)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        tipo = st.radio("Trabajo:", list(cola.TIPOS))
+    parametros = {}
+    if tipo == "agrupar":
+        if not numericas:
+            st.warning("El CSV no tiene columnas numéricas para agregar")
+            return
+        with col2:
+            parametros["por"] = st.selectbox("Agrupar por:", list(df.columns))
+        with col3:
+            parametros["columna"] = st.selectbox("Columna:", numericas)
+        with col4:
+            parametros["funcion"] = st.selectbox("Función:", ["sum", "mean", "count", "min", "max"])
+
+    if st.button("Enviar trabajo"):
+        # Si el dataset está en la caché columnar el worker lo lee de ahí
+        entrada = {"clave": clave} if columnar.existe(clave) else {"csv": archivo.getvalue()}
+        descripcion = f"{tipo} {archivo.name} {' '.join(map(str, parametros.values()))}".strip()
+        try:
+            id_trabajo = cola.enviar(tipo, entrada, descripcion, **parametros)
+        except cola.ColaLlena as e:
+            st.warning(str(e))
+            return
+        trabajos = st.session_state.setdefault("trabajos", [])
+        if id_trabajo not in trabajos:
+            trabajos.append(id_trabajo)
+
+
+# Estado de los trabajos de la sesión. Mientras alguno está activo solo este
+# fragmento se refresca (consulta a SQLite), sin repetir el trabajo.
+def mostrar_trabajos():
+    ids = st.session_state.get("trabajos", [])
+    activos = any(t["estado"] in cola.ESTADOS_ACTIVOS for t in cola.listar(ids))
+
+    @st.fragment(run_every=1 if activos else None)
+    def fragmento():
+        trabajos = cola.listar(ids)
+        if not trabajos:
+            return
+        if activos and not any(t["estado"] in cola.ESTADOS_ACTIVOS for t in trabajos):
+            st.rerun(scope="app")
+
+        st.dataframe([{
+            "id": t["id"],
+            "trabajo": t["descripcion"],
+            "estado": t["estado"],
+            "segundos": round(t["terminado"] - t["iniciado"], 3) if t["terminado"] and t["iniciado"] else None,
+            "error": t["error"] or "",
+        } for t in trabajos], use_container_width=True)
+
+        completados = [t["id"] for t in trabajos if t["estado"] == "completado"]
+        if completados:
+            descripciones = {t["id"]: t["descripcion"] for t in trabajos}
+            elegido = st.selectbox("Ver resultado:", completados, format_func=descripciones.get)
+            st.dataframe(cola.resultado(elegido), use_container_width=True)
+
+    fragmento()
+
+
+def _proceso_terminado(tarea):
+    st.text('¡Completado!')
+    st.success(f"Proceso terminado en {tarea.fin - tarea.inicio:.2f} s")
+
+
+# Alertas y mensajes: contenido constante, se graba una vez y se reproduce
+@estatico
+def _alertas():
+    st.subheader("2. Alertas y Mensajes")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+        st.success("✅ Mensaje de éxito")
+        st.info("ℹ️ Mensaje informativo")
+        st.warning("⚠️ Mensaje de advertencia")
+        st.error("❌ Mensaje de error")
+
+    with col2:
+        show_code("""
+st.success("✅ Mensaje de éxito")
+st.info("ℹ️ Mensaje informativo")
+st.warning("⚠️ Mensaje de advertencia")
+st.error("❌ Mensaje de error")
+        """)
+
+
+# SECCIÓN: Funciones de Control
+def render():
+    st.header("⚡ Funciones de Control y Utilidades")
+
+    # Progress bar
+    st.subheader("1. Barras de Progreso")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplo:**")
+        # El proceso corre en un hilo; la página sigue respondiendo mientras tanto
+        if st.button("Simular Proceso"):
+            st.session_state.tarea_proceso = fondo.lanzar(_simular_proceso)
+        fondo.mostrar_progreso("tarea_proceso", _proceso_terminado)
+
+    with col2:
+        show_code("""
+if st.button("Simular Proceso"):
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    for i in range(101):
+        progress_bar.progress(i)
+        status_text.text(f'Progreso: {i}%')
+        time.sleep(0.01)
+
+    st.success("Proceso terminado")
+        """)
+
+    _alertas()
+
+    # Spinner
+    st.subheader("3. Spinner de Carga")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("Cargar con Spinner"):
+            st.session_state.tarea_carga = fondo.lanzar(_cargar)
+        fondo.mostrar_progreso("tarea_carga", lambda tarea: st.success('¡Listo!'), barra=False)
+
+    with col2:
+        show_code("""
+if st.button("Cargar"):
+    with st.spinner('Cargando...'):
+        time.sleep(2)
+    st.success('¡Listo!')
+        """)
+
+    # Balloons y snow
+    st.subheader("4. Efectos Especiales")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if st.button("🎈 Globos"):
+            st.balloons()
+
+    with col2:
+        if st.button("❄️ Nieve"):
+            st.snow()
+
+    with col3:
+        st.write("Efectos de celebración")
+
+    # Cola de trabajos
+    st.subheader("5. Cola de Trabajos")
+    st.write("Los cálculos pesados se envían a procesos en segundo plano y su resultado queda guardado: no se recalcula en cada rerun.")
+
+    archivo_trabajo = st.file_uploader("CSV para procesar", type=['csv'], key="csv_trabajo")
+    if archivo_trabajo is not None:
+        enviar_trabajo(archivo_trabajo)
+
+    mostrar_trabajos()
@@ -0,0 +1,355 @@
+import streamlit as st
+from datetime import datetime, date
+
+from datos.registros import validar, obtener_escritor, BufferLleno, PAISES, PROFESIONES, DISPONIBILIDADES
+from secciones.comun import show_code
+
+
+# SECCIÓN: Entrada de Datos
+def render():
+    st.header("📝 Entrada de Datos - Inputs y Formularios")
+
+    # Inputs de texto
+    st.subheader("1. Inputs de Texto")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+
+        # Text input básico
+        nombre = st.text_input("Nombre completo:", placeholder="Ingresa tu nombre")
+        if nombre:
+            st.write(f"Hola, **{nombre}**!")
+
+        # Text input con password
+        password = st.text_input("Contraseña:", type="password")
+        if password:
+            st.write("✅ Contraseña ingresada")
+
+        # Text area para textos largos
+        comentario = st.text_area(
+            "Comentarios:",
+            placeholder="Escribe tu comentario aquí...",
+            height=100
+        )
+        if comentario:
+            st.write(f"Comentario ({len(comentario)} caracteres): {comentario[:50]}...")
+
+    with col2:
+        show_code("""
+# Input básico
+nombre = st.text_input(
+    "Nombre completo:",
+    placeholder="Ingresa tu nombre"
+)
+
+# Input con contraseña
+password = st.text_input(
+    "Contraseña:",
+    type="password"
+)
+
+# Área de texto
+comentario = st.text_area(
+    "Comentarios:",
+    placeholder="Escribe aquí...",
+    height=100
+)
+        """)
+
+    # Inputs numéricos
+    st.subheader("2. Inputs Numéricos")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+
+        # Number input
+        edad = st.number_input(
+            "Edad:",
+            min_value=0,
+            max_value=120,
+            value=25,
+            step=1
+        )
+        st.write(f"Edad: {edad} años")
+
+        # Number input con decimales
+        precio = st.number_input(
+            "Precio ($):",
+            min_value=0.0,
+            value=100.0,
+            step=0.01,
+            format="%.2f"
+        )
+        st.write(f"Precio: ${precio:.2f}")
+
+        # Slider
+        descuento = st.slider(
+            "Descuento (%):",
+            min_value=0,
+            max_value=100,
+            value=10,
+            step=5
+        )
+        precio_final = precio * (1 - descuento/100)
+        st.write(f"Precio con descuento: ${precio_final:.2f}")
+
+        # Range slider
+        rango_edad = st.select_slider(
+            "Rango de edad:",
+            options=["18-25", "26-35", "36-45", "46-55", "56+"],
+            value="26-35"
+        )
+        st.write(f"Rango seleccionado: {rango_edad}")
+
+    with col2:
+        show_code("""
+# Input numérico entero
+edad = st.number_input(
+    "Edad:",
+    min_value=0,
+    max_value=120,
+    value=25,
+    step=1
+)
+
+# Input numérico decimal
+precio = st.number_input(
+    "Precio ($):",
+    min_value=0.0,
+    value=100.0,
+    step=0.01,
+    format="%.2f"
+)
+
+# Slider
+descuento = st.slider(
+    "Descuento (%):",
+    min_value=0,
+    max_value=100,
+    value=10
+)
+
+# Select slider
+rango = st.select_slider(
+    "Rango de edad:",
+    options=["18-25", "26-35", "36-45"]
+)
+        """)
+
+    # Selecciones
+    st.subheader("3. Selectores y Opciones")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+
+        # Selectbox
+        pais = st.selectbox(
+            "País:",
+            ["México", "España", "Argentina", "Colombia", "Chile"]
+        )
+        st.write(f"País seleccionado: {pais}")
+
+        # Multiselect
+        hobbies = st.multiselect(
+            "Hobbies:",
+            ["Leer", "Deportes", "Música", "Viajar", "Cocinar", "Tecnología"],
+            default=["Leer", "Tecnología"]
+        )
+        st.write(f"Hobbies: {', '.join(hobbies)}")
+
+        # Radio buttons
+        genero = st.radio(
+            "Género:",
+            ["Masculino", "Femenino", "Otro", "Prefiero no decir"],
+            horizontal=True
+        )
+        st.write(f"Género: {genero}")
+
+        # Checkbox
+        acepta_terminos = st.checkbox("Acepto los términos y condiciones")
+        newsletter = st.checkbox("Suscribirse al newsletter", value=True)
+
+        if acepta_terminos:
+            st.success("✅ Términos aceptados")
+
+    with col2:
+        show_code("""
+# Selectbox
+pais = st.selectbox(
+    "País:",
+    ["México", "España", "Argentina"]
+)
+
+# Multiselect
+hobbies = st.multiselect(
+    "Hobbies:",
+    ["Leer", "Deportes", "Música"],
+    default=["Leer"]
+)
+
+# Radio buttons
+genero = st.radio(
+    "Género:",
+    ["Masculino", "Femenino", "Otro"],
+    horizontal=True
+)
+
+# Checkbox
+acepta = st.checkbox("Acepto términos")
+newsletter = st.checkbox("Newsletter", value=True)
+        """)
+
+    # Fechas y tiempo
+    st.subheader("4. Fechas y Tiempo")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+
+        # Date input
+        fecha_nacimiento = st.date_input(
+            "Fecha de nacimiento:",
+            value=date(1990, 1, 1),
+            min_value=date(1900, 1, 1),
+            max_value=date.today()
+        )
+
+        # Calcular edad
+        if fecha_nacimiento:
+            edad_calculada = (date.today() - fecha_nacimiento).days // 365
+            st.write(f"Edad calculada: {edad_calculada} años")
+
+        # Time input
+        hora_reunion = st.time_input("Hora de reunión:")
+        st.write(f"Reunión programada: {hora_reunion}")
+
+        # Datetime input (combinando ambos)
+        st.write("**Evento completo:**")
+        col_fecha, col_hora = st.columns(2)
+        with col_fecha:
+            fecha_evento = st.date_input("Fecha del evento:")
+        with col_hora:
+            hora_evento = st.time_input("Hora del evento:")
+
+        if fecha_evento and hora_evento:
+            evento_completo = datetime.combine(fecha_evento, hora_evento)
+            st.info(f"📅 Evento: {evento_completo.strftime('%d/%m/%Y a las %H:%M')}")
+
+    with col2:
+        show_code("""
+from datetime import datetime, date
+
+# Date input
+fecha_nacimiento = st.date_input(
+    "Fecha de nacimiento:",
+    value=date(1990, 1, 1),
+    min_value=date(1900, 1, 1),
+    max_value=date.today()
+)
+
+# Time input
+hora = st.time_input("Hora de reunión:")
+
+# Combinando fecha y hora
+fecha_evento = st.date_input("Fecha:")
+hora_evento = st.time_input("Hora:")
+
+evento = datetime.combine(fecha_evento, hora_evento)
+        """)
+
+    # Formulario completo
+    st.subheader("5. Formulario Completo")
+
+    st.markdown("**Ejemplo de formulario con st.form:**")
+
+    with st.form("formulario_registro"):
+        st.write("### 📋 Formulario de Registro")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            form_nombre = st.text_input("Nombre completo: *")
+            form_email = st.text_input("Email: *", placeholder="usuario@email.com")
+            form_telefono = st.text_input("Teléfono:")
+            form_edad = st.number_input("Edad:", min_value=18, max_value=100, value=25)
+
+        with col2:
+            form_pais = st.selectbox("País:", PAISES)
+            form_profesion = st.selectbox("Profesión:", PROFESIONES)
+            form_experiencia = st.slider("Años de experiencia:", 0, 30, 5)
+            form_disponibilidad = st.radio("Disponibilidad:", DISPONIBILIDADES)
+
+        form_comentarios = st.text_area("Comentarios adicionales:")
+        form_acepta = st.checkbox("Acepto los términos y condiciones *")
+
+        # Botón de submit
+        submitted = st.form_submit_button("🚀 Registrarse", type="primary")
+
+        if submitted:
+            registro = {
+                "nombre": form_nombre.strip(),
+                "email": form_email.strip(),
+                "telefono": form_telefono.strip(),
+                "edad": int(form_edad),
+                "pais": form_pais,
+                "profesion": form_profesion,
+                "experiencia": form_experiencia,
+                "disponibilidad": form_disponibilidad,
+                "comentarios": form_comentarios,
+                "acepta": form_acepta
+            }
+            errores = validar(registro)
+            if not errores:
+                # Se encola; un hilo lo escribe a SQLite junto con otros registros
+                try:
+                    obtener_escritor().encolar(registro)
+                except BufferLleno as e:
+                    st.error(f"❌ {e}")
+                else:
+                    st.success("✅ ¡Registro exitoso!")
+                    st.json(registro)
+            else:
+                st.error("❌ Por favor revisa los campos:\n\n" + "\n".join(f"- {e}" for e in errores))
+
+    # Código del formulario
+    with st.expander("Ver código del formulario"):
+        show_code("""
+with st.form("formulario_registro"):
+    st.write("### Formulario de Registro")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        nombre = st.text_input("Nombre: *")
+        email = st.text_input("Email: *")
+        telefono = st.text_input("Teléfono:")
+
+    with col2:
+        pais = st.selectbox("País:", ["México", "España"])
+        profesion = st.selectbox("Profesión:", ["Estudiante", "Empleado"])
+
+    acepta = st.checkbox("Acepto términos *")
+
+    submitted = st.form_submit_button("Registrarse")
+
+    if submitted:
+        if nombre and email and acepta:
+            st.success("¡Registro exitoso!")
+        else:
+            st.error("Completa campos obligatorios")
+        """)
+
+    # Tips y mejores prácticas
+    st.subheader("💡 Tips y Mejores Prácticas")
+    st.info("""
+    **Para Entrada de Datos:**
+    - Usa `placeholder` para dar ejemplos de formato
+    - Establece `min_value` y `max_value` para validar rangos
+    - Agrupa inputs relacionados en formularios con `st.form()`
+    - Usa `st.columns()` para organizar inputs en diseño horizontal
+    - Valida datos antes de procesarlos
+    - Proporciona feedback inmediato al usuario
+    """)
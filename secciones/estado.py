@@ -0,0 +1,103 @@
+import streamlit as st
+
+from secciones.comun import show_code
+from sesion.coleccion import ColeccionAcotada, reporte as reporte_tareas
+from sesion.memoria import memoria
+
+TAREAS_POR_PAGINA = 20
+
+
+def _agregar_tarea():
+    nueva_tarea = st.session_state.input_tarea
+    if nueva_tarea:
+        st.session_state.tareas.agregar(nueva_tarea)
+
+
+# SECCIÓN: Estado de Sesión
+def render():
+    st.header("💾 Estado de Sesión (st.session_state)")
+
+    st.subheader("¿Qué es el Session State?")
+    st.write("Permite mantener variables entre ejecuciones de la app")
+
+    # Contador ejemplo
+    st.subheader("Ejemplo: Contador")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Funcionamiento:**")
+
+        # Inicializar contador
+        if 'contador' not in st.session_state:
+            st.session_state.contador = 0
+
+        # Botones para incrementar/decrementar
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            if st.button("➕ Incrementar"):
+                st.session_state.contador += 1
+        with col_b:
+            if st.button("➖ Decrementar"):
+                st.session_state.contador -= 1
+        with col_c:
+            if st.button("🔄 Reset"):
+                st.session_state.contador = 0
+
+        st.metric("Contador", st.session_state.contador)
+
+    with col2:
+        show_code("""
+# Inicializar
+if 'contador' not in st.session_state:
+    st.session_state.contador = 0
+
+# Usar
+if st.button("➕ Incrementar"):
+    st.session_state.contador += 1
+
+if st.button("➖ Decrementar"):
+    st.session_state.contador -= 1
+
+st.metric("Contador", st.session_state.contador)
+        """)
+
+    # Lista de tareas ejemplo
+    st.subheader("Ejemplo: Lista de Tareas")
+
+    # Inicializar lista (ids estables y tamaño acotado por sesión)
+    if not isinstance(st.session_state.get('tareas'), ColeccionAcotada):
+        st.session_state.tareas = ColeccionAcotada()
+    tareas = st.session_state.tareas
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.text_input("Nueva tarea:", key="input_tarea")
+
+    with col2:
+        # Los callbacks se ejecutan antes del rerun: no hace falta st.rerun()
+        st.button("Agregar Tarea", on_click=_agregar_tarea)
+
+    # Mostrar tareas, paginadas
+    if tareas:
+        st.write(f"**Tareas ({len(tareas)}):**")
+        paginas = tareas.paginas(TAREAS_POR_PAGINA)
+        pagina = 1
+        if paginas > 1:
+            pagina = st.number_input("Página:", min_value=1, max_value=paginas, value=1)
+        for posicion, (id_tarea, tarea) in enumerate(tareas.pagina(pagina, TAREAS_POR_PAGINA), 1):
+            col_tarea, col_eliminar = st.columns([4, 1])
+            with col_tarea:
+                st.write(f"{(pagina - 1) * TAREAS_POR_PAGINA + posicion}. {tarea}")
+            with col_eliminar:
+                st.button("🗑️", key=f"eliminar_{id_tarea}", on_click=tareas.eliminar, args=(id_tarea,))
+
+    if tareas.desalojados:
+        st.warning(f"Se descartaron {tareas.desalojados} tareas antiguas por el límite de la sesión")
+
+    with st.expander("Memoria de las listas de tareas (todas las sesiones)"):
+        st.json(reporte_tareas())
+
+    with st.expander("Memoria de session_state (todas las sesiones)"):
+        st.json(memoria().reporte())
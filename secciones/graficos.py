@@ -0,0 +1,204 @@
+import streamlit as st
+
+from datos.demo import (
+    serie_demo, mapa_demo, opciones_con_defecto,
+    OPCIONES_FILAS, OPCIONES_PUNTOS, FILAS_DEFECTO, PUNTOS_DEFECTO, CENTRO_MAPA
+)
+from datos.muestreo import METODOS, PUNTOS_MAXIMOS
+from datos.fuentes import (
+    ReproduccionSerie, FuenteViva, obtener_fuente, TIPOS_FUENTE, ARCHIVO_VIVO, PUERTO_VIVO
+)
+from graficos.figuras import figura_dispersion, datos_grafico, MODOS_RENDER, UMBRAL_WEBGL
+from graficos.vivo import transmitir
+from graficos.mapas import construir_piramide, celdas_visibles, NIVELES_ZOOM, UMBRAL_AGREGACION
+from monitoreo import medir
+from secciones.comun import show_code
+
+# Presupuesto de puntos para la dispersión en modo WebGL
+PUNTOS_WEBGL = 500_000
+# Series en vivo: duraciones de la conexión y puntos de la ventana reciente
+# que se redibuja en cada actualización
+DURACIONES_VIVO = [10, 30, 60, 300]
+FILAS_REPRODUCCION = 100_000
+MAX_FILAS_VIVO = 5_000
+
+
+# Conecta el gráfico a una fuente en vivo (reproducción de la serie demo,
+# telemetría generada, archivo seguido o socket UDP). Las fuentes guardan los
+# últimos puntos en un buffer circular y el gráfico se actualiza a como mucho
+# `fps` veces por segundo, así ni el servidor ni el navegador crecen sin límite.
+@st.fragment
+def mostrar_serie_en_vivo():
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        tipo = st.selectbox("Fuente:", ["Reproducción demo"] + TIPOS_FUENTE)
+    with col2:
+        velocidad = st.select_slider("Puntos por segundo:", [10, 100, 1_000, 10_000, 100_000], value=100)
+    with col3:
+        fps = st.select_slider("Actualizaciones por segundo:", [1, 2, 5, 10], value=5)
+    segundos = st.select_slider("Duración (s):", DURACIONES_VIVO, value=DURACIONES_VIVO[0])
+
+    if tipo == "Reproducción demo":
+        fuente = None
+    elif tipo == "Generador local":
+        fuente = obtener_fuente(tipo, velocidad)
+    else:
+        fuente = obtener_fuente(tipo)
+        destino = ARCHIVO_VIVO if tipo == "Archivo (tail)" else f"udp://127.0.0.1:{PUERTO_VIVO}"
+        st.caption(f"Escribe líneas `a,b,c` en {destino} (la velocidad la marca quien escribe)")
+
+    if st.button(f"▶️ Conectar ({segundos} s)"):
+        if fuente is None:
+            fuente = ReproduccionSerie(serie_demo(FILAS_REPRODUCCION), velocidad)
+        grafico = transmitir(fuente, st.empty(), segundos, fps, MAX_FILAS_VIVO)
+        if getattr(fuente, "error", None):
+            st.error(f"La fuente falló: {fuente.error}")
+        st.caption(
+            f"Enviados {grafico.puntos_enviados:,} puntos "
+            f"(reenviando el historial completo serían {grafico.puntos_historial:,}; "
+            f"{grafico.redibujados} actualizaciones de {MAX_FILAS_VIVO:,} puntos como mucho)"
+        )
+        if isinstance(fuente, FuenteViva):
+            buffer = fuente.buffer
+            st.caption(
+                f"Buffer: {min(buffer.total, buffer.capacidad):,} de {buffer.capacidad:,} puntos "
+                f"({buffer.bytes / 1024 / 1024:.1f} MB fijos) · {buffer.total:,} recibidos"
+            )
+
+
+# SECCIÓN: Gráficos y Charts
+def render():
+    st.header("📈 Gráficos y Visualizaciones")
+
+    # Tamaño de la serie y reducción de puntos antes de enviarla al navegador
+    with st.expander("⚙️ Datos y muestreo"):
+        col_filas, col_metodo = st.columns(2)
+        with col_filas:
+            opciones, indice = opciones_con_defecto(OPCIONES_FILAS, FILAS_DEFECTO)
+            filas = st.selectbox("Filas de la serie:", opciones, index=indice)
+        with col_metodo:
+            metodo = st.radio("Muestreo:", METODOS, horizontal=True)
+        # Zoom: se vuelve a muestrear solo la ventana visible
+        inicio, fin = st.slider("Ventana (zoom):", 0, filas, (0, filas))
+        modo_render = st.radio(
+            "Renderizado Plotly:",
+            MODOS_RENDER,
+            horizontal=True,
+            help="WebGL (Scattergl) permite dibujar cientos de miles de puntos; Auto lo activa en series grandes"
+        )
+
+    # Datos de ejemplo (deterministas y compartidos entre sesiones)
+    chart_data = serie_demo(filas)
+    ventana = chart_data.iloc[inicio:max(fin, inicio + 1)]
+    # Los datos demo son deterministas: filas y ventana bastan como clave
+    clave_ventana = f"demo-{filas}-{inicio}-{fin}"
+    vista = datos_grafico(ventana, PUNTOS_MAXIMOS, metodo, clave_ventana)
+    if len(vista) < len(chart_data):
+        st.caption(f"Mostrando {len(vista):,} de {len(chart_data):,} puntos ({metodo})")
+
+    # Gráficos básicos de Streamlit
+    st.subheader("1. Gráficos Básicos de Streamlit")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Line Chart:**")
+        with medir("st.line_chart", "st"):
+            st.line_chart(vista)
+
+        st.markdown("**Bar Chart:**")
+        with medir("st.bar_chart", "st"):
+            st.bar_chart(vista['A'])
+
+    with col2:
+        show_code("""
+chart_data = pd.DataFrame(
+    np.random.randn(20, 3),
+    columns=['A', 'B', 'C']
+)
+
+st.line_chart(chart_data)
+st.bar_chart(chart_data['A'])
+        """)
+
+    # Plotly
+    st.subheader("2. Gráficos con Plotly")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Gráfico Interactivo:**")
+        # Con WebGL el navegador aguanta muchos más puntos que con SVG.
+        # Con este presupuesto se usa min/max, que está vectorizado.
+        datos_dispersion = vista
+        if modo_render == "WebGL" or (modo_render == "Auto" and len(ventana) > UMBRAL_WEBGL):
+            datos_dispersion = datos_grafico(ventana[['A']], PUNTOS_WEBGL, "Min/Max", f"{clave_ventana}-A")
+        fig = figura_dispersion(
+            datos_dispersion.index,
+            datos_dispersion['A'],
+            "Gráfico de Dispersión",
+            modo_render
+        )
+        with medir("st.plotly_chart", "st"):
+            st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        show_code("""
+import plotly.express as px
+
+fig = px.scatter(
+    x=chart_data.index,
+    y=chart_data['A'],
+    title="Gráfico de Dispersión"
+)
+st.plotly_chart(fig, use_container_width=True)
+        """)
+
+    # Mapa
+    st.subheader("3. Mapas")
+
+    opciones, indice = opciones_con_defecto(OPCIONES_PUNTOS, PUNTOS_DEFECTO)
+    puntos_mapa = st.selectbox("Puntos del mapa:", opciones, index=indice)
+
+    map_data = mapa_demo(puntos_mapa)  # Ciudad de México
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if len(map_data) <= UMBRAL_AGREGACION:
+            st.markdown("**Mapa de puntos:**")
+            with medir("st.map", "st"):
+                st.map(map_data)
+        else:
+            # Muchos puntos: se envían solo las celdas agregadas de la vista
+            st.markdown("**Mapa agregado por celdas:**")
+            zoom = st.select_slider("Zoom:", options=NIVELES_ZOOM, value=12)
+            lat, lon = map_data['lat'].to_numpy(), map_data['lon'].to_numpy()
+            # Los datos demo son deterministas: basta con su tamaño como clave
+            piramide = construir_piramide(f"demo-{puntos_mapa}", lat, lon)
+            celdas = celdas_visibles(piramide, zoom, *CENTRO_MAPA)
+            with medir("st.map", "st"):
+                st.map(celdas, size='radio', zoom=zoom)
+            st.caption(f"{len(celdas):,} celdas para {len(map_data):,} puntos")
+
+    with col2:
+        show_code("""
+map_data = pd.DataFrame(
+    np.random.randn(100, 2) / [50, 50] + [19.43, -99.13],
+    columns=['lat', 'lon']
+)
+
+st.map(map_data)
+        """)
+
+    # Serie en vivo
+    st.subheader("4. Series en vivo")
+    mostrar_serie_en_vivo()
+
+    show_code("""
+grafico = st.empty()
+while True:
+    ventana = leer_ultimos_puntos(5_000)
+    grafico.line_chart(ventana)  # solo viaja la ventana reciente
+    time.sleep(0.2)
+    """)
@@ -0,0 +1,101 @@
+import streamlit as st
+import pandas as pd
+
+from datos.demo import serie_demo
+from secciones.comun import show_code, estatico
+
+
+# Datos de ejemplo constantes. Solo se usan dentro de bloques estatico, cuya
+# grabación ya los reutiliza: no pasan por la caché compartida.
+def datos_tabla():
+    return pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+
+
+# Partes constantes de la sección: se graban una vez y se reproducen
+@estatico
+def _columnas():
+    st.header("🎨 Layout y Contenedores")
+
+    # Columnas
+    st.subheader("1. Columnas (st.columns)")
+
+    st.markdown("**Ejemplo de 3 columnas:**")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.info("Columna 1")
+        st.write("Contenido de la primera columna")
+
+    with col2:
+        st.success("Columna 2")
+        st.write("Contenido de la segunda columna")
+
+    with col3:
+        st.warning("Columna 3")
+        st.write("Contenido de la tercera columna")
+
+    show_code("""
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.info("Columna 1")
+    st.write("Contenido...")
+
+with col2:
+    st.success("Columna 2")
+
+with col3:
+    st.warning("Columna 3")
+    """)
+
+
+@estatico
+def _pestana_datos():
+    st.write("Contenido de la pestaña de datos")
+    st.dataframe(datos_tabla())
+
+
+@estatico
+def _pestana_graficos():
+    st.write("Contenido de gráficos")
+    chart_data = serie_demo(20)
+    st.line_chart(chart_data)
+
+
+@estatico
+def _expandibles_y_contenedores():
+    # Expandir
+    st.subheader("3. Secciones Expandibles")
+
+    with st.expander("Ver más detalles"):
+        st.write("Este contenido está oculto por defecto")
+        st.json({"ejemplo": "datos", "valor": 123})
+
+    # Contenedores
+    st.subheader("4. Contenedores")
+
+    container = st.container()
+    container.write("Este es un contenedor")
+    container.success("Mensaje en el contenedor")
+
+
+# SECCIÓN: Layout y Contenedores
+def render():
+    _columnas()
+
+    # Tabs: la de configuración tiene un widget y se ejecuta siempre
+    st.subheader("2. Pestañas (st.tabs)")
+
+    tab1, tab2, tab3 = st.tabs(["📊 Datos", "📈 Gráficos", "⚙️ Configuración"])
+
+    with tab1:
+        _pestana_datos()
+
+    with tab2:
+        _pestana_graficos()
+
+    with tab3:
+        st.write("Configuraciones")
+        st.slider("Parámetro 1", 0, 100, 50)
+
+    _expandibles_y_contenedores()
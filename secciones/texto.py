@@ -0,0 +1,80 @@
+import streamlit as st
+import pandas as pd
+
+from secciones.comun import show_code, estatico
+
+
+# Datos de ejemplo constantes. Solo se usan dentro de bloques estatico, cuya
+# grabación ya los reutiliza: no pasan por la caché compartida.
+def datos_ejemplo():
+    return pd.DataFrame({"A": [1, 2], "B": [3, 4]})
+
+
+# SECCIÓN: Elementos de Texto
+# Todo su contenido es constante: se graba una vez y se reproduce
+@estatico
+def render():
+    st.header("🎯 Elementos de Texto Más Utilizados")
+
+    # st.title, st.header, st.subheader
+    st.subheader("1. Títulos y Encabezados")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplo:**")
+        st.title("Título Principal")
+        st.header("Encabezado")
+        st.subheader("Sub-encabezado")
+
+    with col2:
+        show_code("""
+st.title("Título Principal")
+st.header("Encabezado")
+st.subheader("Sub-encabezado")
+        """)
+
+    # st.markdown
+    st.subheader("2. Markdown y Texto Formateado")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplo:**")
+        st.markdown("""
+        **Texto en negrita**
+        *Texto en cursiva*
+        `Código inline`
+
+        - Lista item 1
+        - Lista item 2
+        """)
+
+    with col2:
+        show_code("""
+st.markdown('''
+**Texto en negrita**
+*Texto en cursiva*
+`Código inline`
+
+- Lista item 1
+- Lista item 2
+''')
+        """)
+
+    # st.write
+    st.subheader("3. st.write() - El más versátil")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplo:**")
+        st.write("Texto simple")
+        st.write({"nombre": "Juan", "edad": 30})
+        df_example = datos_ejemplo()
+        st.write(df_example)
+
+    with col2:
+        show_code("""
+st.write("Texto simple")
+st.write({"nombre": "Juan", "edad": 30})
+df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
+st.write(df)
+        """)
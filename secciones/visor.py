@@ -0,0 +1,93 @@
+import streamlit as st
+import numpy as np
+import os
+
+from datos.consultas import obtener_motor
+from datos.exportar import exportar, FORMATOS
+from monitoreo import medir
+
+# Filas por página disponibles y ancho (en columnas) de la ventana enviada
+TAMANOS_PAGINA = [25, 50, 100, 500]
+COLUMNAS_VISIBLES = 20
+
+
+# Visor paginado para frames grandes: el DataFrame se queda en el servidor y
+# al navegador solo viaja la ventana visible (una página de filas y un bloque
+# de columnas). El orden se resuelve con el índice del motor de consultas, que
+# se construye una vez por dataset; cambiar de página es solo un slice.
+# `clave` identifica el dataset (y prefija las claves de los widgets);
+# `filas` permite mostrar un subconjunto, p. ej. el resultado de un filtro.
+# Devuelve las posiciones mostradas, ya ordenadas.
+def mostrar_tabla(df, clave, filas=None):
+    if filas is None:
+        filas = np.arange(len(df))
+    total_columnas = df.shape[1]
+
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+
+    with col1:
+        col_orden = st.selectbox(
+            "Ordenar por:",
+            [None] + list(df.columns),
+            format_func=lambda c: "—" if c is None else c,
+            key=f"{clave}-orden"
+        )
+    with col2:
+        ascendente = st.toggle("Ascendente", value=True, key=f"{clave}-ascendente")
+    with col3:
+        por_pagina = st.selectbox("Filas por página:", TAMANOS_PAGINA, index=1, key=f"{clave}-por-pagina")
+
+    paginas = max(1, -(-len(filas) // por_pagina))
+    clave_pagina = f"{clave}-pagina"
+    # Si un filtro o el tamaño de página reducen el total, volver a una página válida
+    if st.session_state.get(clave_pagina, 1) > paginas:
+        st.session_state[clave_pagina] = paginas
+
+    with col4:
+        pagina = st.number_input("Página:", min_value=1, max_value=paginas, key=clave_pagina)
+
+    primera_columna = 0
+    if total_columnas > COLUMNAS_VISIBLES:
+        primera_columna = st.slider(
+            "Primera columna visible:",
+            0, total_columnas - COLUMNAS_VISIBLES,
+            key=f"{clave}-columnas"
+        )
+
+    if col_orden is not None:
+        filas = obtener_motor(clave, df).ordenar(filas, col_orden, ascendente)
+
+    inicio = (pagina - 1) * por_pagina
+    ventana = df.iloc[
+        filas[inicio:inicio + por_pagina],
+        primera_columna:primera_columna + COLUMNAS_VISIBLES
+    ]
+    with medir("st.dataframe visor", "st"):
+        st.dataframe(ventana, use_container_width=True)
+
+    st.caption(
+        f"Filas {min(inicio + 1, len(filas)):,}–{inicio + len(ventana):,} de {len(filas):,} · "
+        f"columnas {primera_columna + 1}–{primera_columna + ventana.shape[1]} de {total_columnas} · "
+        f"página {pagina} de {paginas}"
+    )
+    return filas
+
+
+# Botón para descargar el frame (o las filas indicadas, en su orden). El
+# archivo se codifica por trozos al pulsar, fuera del script, y queda en
+# disco para las siguientes descargas del mismo contenido y formato.
+def mostrar_descarga(df, clave, nombre, filas=None):
+    col1, col2 = st.columns([1, 2], vertical_alignment="bottom")
+    with col1:
+        formato = st.selectbox("Formato:", list(FORMATOS), key=f"{clave}-formato")
+    extension, mime = FORMATOS[formato]
+    total = len(df) if filas is None else len(filas)
+    with col2:
+        st.download_button(
+            f"⬇️ Descargar {total:,} filas",
+            data=lambda: open(exportar(df, clave, formato, filas), "rb"),
+            file_name=os.path.splitext(nombre)[0] + extension,
+            mime=mime,
+            on_click="ignore",
+            key=f"{clave}-descarga"
+        )
@@ -0,0 +1,83 @@
+import streamlit as st
+import pandas as pd
+
+from cache_compartida import cacheado, TTL_SECCIONES
+from datos.demo import serie_demo, opciones_con_defecto, OPCIONES_FILAS, FILAS_DEFECTO
+from secciones.comun import show_code
+from secciones.visor import mostrar_tabla
+
+
+# Datos de ejemplo constantes, construidos una vez y compartidos entre sesiones
+@cacheado("secciones", ttl=TTL_SECCIONES)
+def datos_ventas():
+    return pd.DataFrame({
+        'Producto': ['A', 'B', 'C', 'D', 'E'],
+        'Ventas': [100, 200, 150, 300, 250],
+        'Región': ['Norte', 'Sur', 'Este', 'Oeste', 'Centro']
+    })
+
+
+# SECCIÓN: Visualización de Datos
+def render():
+    st.header("📊 Visualización de Datos")
+
+    # DataFrame y métricas
+    st.subheader("1. Mostrar DataFrames")
+
+    # Crear datos de ejemplo
+    df_sample = datos_ventas()
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**st.dataframe() - Interactivo:**")
+        st.dataframe(df_sample, use_container_width=True)
+
+        st.markdown("**st.table() - Estático:**")
+        st.table(df_sample.head(3))
+
+    with col2:
+        show_code("""
+df = pd.DataFrame({
+    'Producto': ['A', 'B', 'C', 'D', 'E'],
+    'Ventas': [100, 200, 150, 300, 250],
+    'Región': ['Norte', 'Sur', 'Este', 'Oeste', 'Centro']
+})
+
+st.dataframe(df, use_container_width=True)
+st.table(df.head(3))
+        """)
+
+    # Métricas
+    st.subheader("2. Métricas y KPIs")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Ventas Totales", "1,000", "10%")
+    with col2:
+        st.metric("Usuarios", "500", "-5%")
+    with col3:
+        st.metric("Ingresos", "$50K", "15%")
+    with col4:
+        st.metric("Conversión", "2.5%", "0.5%")
+
+    show_code("""
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("Ventas Totales", "1,000", "10%")
+with col2:
+    st.metric("Usuarios", "500", "-5%")
+    """)
+
+    # Tablas grandes: solo se envía la ventana visible
+    st.subheader("3. DataFrames grandes (visor paginado)")
+
+    opciones, indice = opciones_con_defecto(OPCIONES_FILAS, FILAS_DEFECTO)
+    filas = st.selectbox("Filas del dataset:", opciones, index=indice, format_func=lambda n: f"{n:,}")
+    mostrar_tabla(serie_demo(filas), f"demo-{filas}")
+
+    show_code("""
+# st.dataframe(df) serializa el frame entero; el visor envía solo la página
+# visible y ordena en el servidor con el índice del motor de consultas
+mostrar_tabla(df, "mi-dataset")
+    """)
@@ -0,0 +1,80 @@
+import streamlit as st
+
+from secciones.comun import show_code
+
+
+# SECCIÓN: Widgets Interactivos
+def render():
+    st.header("🎮 Widgets Interactivos Más Populares")
+
+    # Botones
+    st.subheader("1. Botones")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+        if st.button("Botón Simple"):
+            st.success("¡Botón presionado!")
+
+        if st.button("Procesar Datos", type="primary"):
+            st.info("Procesando...")
+
+    with col2:
+        show_code("""
+if st.button("Botón Simple"):
+    st.success("¡Botón presionado!")
+
+if st.button("Procesar", type="primary"):
+    st.info("Procesando...")
+        """)
+
+    # Selectores
+    st.subheader("2. Selectores")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+        opcion = st.selectbox("Elige una opción:", ["Opción 1", "Opción 2", "Opción 3"])
+        st.write(f"Seleccionaste: {opcion}")
+
+        multiples = st.multiselect("Múltiples opciones:", ["A", "B", "C", "D"])
+        st.write(f"Seleccionaste: {multiples}")
+
+    with col2:
+        show_code("""
+opcion = st.selectbox(
+    "Elige una opción:",
+    ["Opción 1", "Opción 2", "Opción 3"]
+)
+
+multiples = st.multiselect(
+    "Múltiples opciones:",
+    ["A", "B", "C", "D"]
+)
+        """)
+
+    # Sliders y inputs
+    st.subheader("3. Sliders e Inputs")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Ejemplos:**")
+        valor = st.slider("Selecciona valor:", 0, 100, 50)
+        st.write(f"Valor: {valor}")
+
+        numero = st.number_input("Ingresa número:", value=10)
+        st.write(f"Número: {numero}")
+
+        texto = st.text_input("Tu nombre:")
+        if texto:
+            st.write(f"Hola, {texto}!")
+
+    with col2:
+        show_code("""
+valor = st.slider("Selecciona valor:", 0, 100, 50)
+numero = st.number_input("Ingresa número:", value=10)
+texto = st.text_input("Tu nombre:")
+
+if texto:
+    st.write(f"Hola, {texto}!")
+        """)
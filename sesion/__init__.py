@@ -0,0 +1 @@
+# Estructuras y contabilidad de memoria para st.session_state
@@ -0,0 +1,85 @@
+import streamlit as st
+import itertools
+import sys
+import threading
+import weakref
+
+# Límites por sesión
+MAX_ELEMENTOS = 5_000
+MAX_BYTES = 1024 * 1024
+
+
+# Colección con ids estables para guardar en st.session_state.
+# Un dict conserva el orden de inserción y borra por id en O(1); al superar
+# los límites se desalojan los elementos más antiguos.
+class ColeccionAcotada:
+    def __init__(self, max_elementos=MAX_ELEMENTOS, max_bytes=MAX_BYTES):
+        self.max_elementos = max_elementos
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.desalojados = 0
+        self._elementos = {}
+        self._siguiente_id = 0
+        registro().add(self)
+
+    def agregar(self, valor):
+        id_elemento = self._siguiente_id
+        self._siguiente_id += 1
+        self._elementos[id_elemento] = valor
+        self.bytes += sys.getsizeof(valor)
+        while self._elementos and (len(self._elementos) > self.max_elementos or self.bytes > self.max_bytes):
+            self.eliminar(next(iter(self._elementos)))
+            self.desalojados += 1
+        return id_elemento
+
+    def eliminar(self, id_elemento):
+        valor = self._elementos.pop(id_elemento, None)
+        if valor is not None:
+            self.bytes -= sys.getsizeof(valor)
+
+    # [(id, valor), ...] de una página (numerada desde 1)
+    def pagina(self, numero, tamano):
+        inicio = (numero - 1) * tamano
+        return list(itertools.islice(self._elementos.items(), inicio, inicio + tamano))
+
+    def paginas(self, tamano):
+        return max(1, -(-len(self._elementos) // tamano))
+
+    def __len__(self):
+        return len(self._elementos)
+
+    def __bool__(self):
+        return bool(self._elementos)
+
+
+class _Registro:
+    def __init__(self):
+        self._colecciones = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def add(self, coleccion):
+        with self._lock:
+            self._colecciones.add(coleccion)
+
+    def colecciones(self):
+        with self._lock:
+            return list(self._colecciones)
+
+
+# Colecciones vivas de todas las sesiones (referencias débiles: al cerrarse
+# una sesión su colección desaparece del registro)
+@st.cache_resource
+def registro():
+    return _Registro()
+
+
+# Resumen de memoria de todas las sesiones
+def reporte():
+    colecciones = registro().colecciones()
+    return {
+        "sesiones": len(colecciones),
+        "elementos": sum(len(c) for c in colecciones),
+        "bytes": sum(c.bytes for c in colecciones),
+        "max_bytes_sesion": max((c.bytes for c in colecciones), default=0),
+        "desalojados": sum(c.desalojados for c in colecciones),
+    }
@@ -0,0 +1,200 @@
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+
+# Presupuesto global (todas las sesiones) para los valores derramables en RAM
+PRESUPUESTO_BYTES = int(os.environ.get("ST_APP_PRESUPUESTO_SESIONES", 512 * 1024 * 1024))
+# Directorio de derrame: por defecto uno privado (0700, nombre aleatorio) creado
+# con mkdtemp la primera vez que hace falta. Los valores se vuelven a cargar con
+# pickle, así que nunca se usa un directorio fijo que otro usuario pueda crear.
+DIRECTORIO_DERRAME = os.environ.get("ST_APP_DERRAME_DIR")
+# Un valor sin accesos en este tiempo se considera frío
+SEGUNDOS_FRIO = 60
+# Las mediciones de sesiones que no han hecho rerun en este tiempo se olvidan
+SEGUNDOS_SESION_INACTIVA = 3600
+
+
+_lock_directorio = threading.Lock()
+_directorio = None
+
+
+# Directorio de derrame del proceso. Si se configura uno por entorno debe ser
+# del usuario que ejecuta la app y no accesible para otros.
+def _directorio_derrame():
+    global _directorio
+    with _lock_directorio:
+        if _directorio is None:
+            if DIRECTORIO_DERRAME:
+                os.makedirs(DIRECTORIO_DERRAME, mode=0o700, exist_ok=True)
+                info = os.stat(DIRECTORIO_DERRAME)
+                if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+                    raise PermissionError(f"{DIRECTORIO_DERRAME} debe ser privado del usuario actual")
+                _directorio = DIRECTORIO_DERRAME
+            else:
+                _directorio = tempfile.mkdtemp(prefix="st-app-derrame-")
+        return _directorio
+
+
+# Tamaño aproximado en bytes de un valor de session_state
+def tamano(valor, profundidad=0):
+    if isinstance(valor, Derramable):
+        return valor.bytes_en_memoria
+    # pandas/numpy solo si alguna página ya los cargó: este módulo se importa
+    # desde app.py y no debe arrastrarlos a las secciones ligeras
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(valor, pd.DataFrame):
+        return int(valor.memory_usage(deep=True).sum())
+    if pd is not None and isinstance(valor, pd.Series):
+        return int(valor.memory_usage(deep=True))
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if isinstance(valor, (str, bytes, bytearray, int, float, bool)) or valor is None:
+        return sys.getsizeof(valor)
+    if hasattr(valor, "getbuffer"):
+        # UploadedFile / BytesIO
+        return valor.getbuffer().nbytes
+    if profundidad >= 4:
+        return sys.getsizeof(valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(
+            tamano(k, profundidad + 1) + tamano(v, profundidad + 1) for k, v in valor.items()
+        )
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return sys.getsizeof(valor) + sum(tamano(v, profundidad + 1) for v in valor)
+    if hasattr(valor, "bytes"):
+        # ColeccionAcotada y similares llevan su propia cuenta
+        return sys.getsizeof(valor) + int(valor.bytes)
+    return sys.getsizeof(valor)
+
+
+# Contenedor para valores grandes de session_state (p. ej. DataFrames subidos).
+# Si el presupuesto global se supera puede derramarse a disco; `.valor` lo
+# vuelve a cargar de forma transparente.
+class Derramable:
+    def __init__(self, valor):
+        self._valor = valor
+        self._ruta = None
+        self.bytes = tamano(valor)
+        self.ultimo_acceso = time.time()
+        self._lock = threading.Lock()
+        memoria().registrar(self)
+
+    @property
+    def valor(self):
+        with self._lock:
+            self.ultimo_acceso = time.time()
+            if self._valor is None and self._ruta is not None:
+                with open(self._ruta, "rb") as f:
+                    self._valor = pickle.load(f)
+                os.remove(self._ruta)
+                self._ruta = None
+            return self._valor
+
+    @property
+    def en_disco(self):
+        return self._ruta is not None
+
+    @property
+    def bytes_en_memoria(self):
+        return 0 if self.en_disco else self.bytes
+
+    def derramar(self):
+        with self._lock:
+            if self.en_disco:
+                return
+            ruta = os.path.join(_directorio_derrame(), f"{uuid.uuid4().hex}.pkl")
+            with open(ruta, "wb") as f:
+                pickle.dump(self._valor, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._ruta, self._valor = ruta, None
+
+    def __del__(self):
+        if self._ruta is not None:
+            try:
+                os.remove(self._ruta)
+            except OSError:
+                pass
+
+
+# Registro global: valores derramables vivos y tamaño medido de cada sesión
+class _Memoria:
+    def __init__(self):
+        self._derramables = weakref.WeakSet()
+        self._sesiones = {}
+        self.derrames = 0
+        self._lock = threading.Lock()
+
+    def registrar(self, derramable):
+        with self._lock:
+            self._derramables.add(derramable)
+
+    def anotar_sesion(self, id_sesion, bytes_sesion):
+        ahora = time.time()
+        with self._lock:
+            self._sesiones[id_sesion] = (bytes_sesion, ahora)
+            for clave, (_, visto) in list(self._sesiones.items()):
+                if ahora - visto > SEGUNDOS_SESION_INACTIVA:
+                    del self._sesiones[clave]
+
+    def sesiones(self):
+        with self._lock:
+            return dict(self._sesiones)
+
+    # Derrama los valores más grandes entre los fríos (y, si no basta, los
+    # menos usados) hasta volver a estar dentro del presupuesto
+    def aplicar_presupuesto(self, presupuesto=PRESUPUESTO_BYTES):
+        with self._lock:
+            en_memoria = [d for d in self._derramables if not d.en_disco]
+        total = sum(d.bytes for d in en_memoria)
+        if total <= presupuesto:
+            return 0
+
+        limite_frio = time.time() - SEGUNDOS_FRIO
+        frios = sorted((d for d in en_memoria if d.ultimo_acceso < limite_frio), key=lambda d: -d.bytes)
+        calientes = sorted((d for d in en_memoria if d.ultimo_acceso >= limite_frio), key=lambda d: d.ultimo_acceso)
+        derramados = 0
+        for derramable in frios + calientes:
+            if total <= presupuesto:
+                break
+            derramable.derramar()
+            total -= derramable.bytes
+            derramados += 1
+        with self._lock:
+            self.derrames += derramados
+        return derramados
+
+    def reporte(self):
+        with self._lock:
+            derramables = list(self._derramables)
+        return {
+            "sesiones": len(self._sesiones),
+            "bytes_sesiones": sum(b for b, _ in self._sesiones.values()),
+            "derramables_en_memoria": sum(d.bytes for d in derramables if not d.en_disco),
+            "derramables_en_disco": sum(d.bytes for d in derramables if d.en_disco),
+            "presupuesto": PRESUPUESTO_BYTES,
+            "derrames": self.derrames,
+        }
+
+
+@st.cache_resource
+def memoria():
+    return _Memoria()
+
+
+# Mide el session_state de la sesión actual y aplica el presupuesto global.
+# Se llama al final de cada rerun.
+def contabilizar_sesion():
+    contexto = get_script_run_ctx()
+    if contexto is None:
+        return
+    bytes_sesion = sum(tamano(st.session_state[clave]) for clave in list(st.session_state.keys()))
+    registro = memoria()
+    registro.anotar_sesion(contexto.session_id, bytes_sesion)
+    registro.aplicar_presupuesto()
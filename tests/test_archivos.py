@@ -0,0 +1,22 @@
+import os
+
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def _seccion_archivos():
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    return at.sidebar.selectbox[0].select("📁 Carga de Archivos").run()
+
+
+# Mismo contenido con distinto nombre: cada visor necesita sus propias claves
+def test_archivos_multiples_iguales_con_distinto_nombre():
+    at = _seccion_archivos()
+    contenido = b"x,y\n1,2\n3,4\n"
+    at.file_uploader[1].set_value([
+        ("a.csv", contenido, "text/csv"),
+        ("b.csv", contenido, "text/csv"),
+    ]).run()
+    assert not at.exception
+    assert len(at.session_state["archivos_parseados"]) == 2
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from datos.consultas import MotorConsultas, FUNCIONES_AGREGACION
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    filas = 2_000
+    valores = rng.normal(100, 20, filas)
+    valores[rng.random(filas) < 0.1] = np.nan
+    region = rng.choice(["Norte", "Sur", "Este", "Oeste"], filas).astype(object)
+    region[rng.random(filas) < 0.05] = None
+    return pd.DataFrame({
+        "region": region,
+        "producto": rng.choice(list("ABCDE"), filas),
+        "ventas": valores,
+        "unidades": rng.integers(0, 50, filas),
+    })
+
+
+def test_filtrar_categoria_y_rango(df):
+    motor = MotorConsultas(df)
+    filas = motor.filtrar([("categoria", "region", ["Norte", "Sur"]), ("rango", "ventas", (90.0, 110.0))])
+    esperado = np.flatnonzero(df["region"].isin(["Norte", "Sur"]) & df["ventas"].between(90, 110))
+    np.testing.assert_array_equal(filas, esperado)
+
+
+def test_filtrar_sin_filtros_y_sin_coincidencias(df):
+    motor = MotorConsultas(df)
+    np.testing.assert_array_equal(motor.filtrar([]), np.arange(len(df)))
+    assert len(motor.filtrar([("categoria", "region", ["Ninguna"])])) == 0
+
+
+@pytest.mark.parametrize("col", ["ventas", "producto"])
+@pytest.mark.parametrize("ascendente", [True, False])
+def test_ordenar(df, col, ascendente):
+    motor = MotorConsultas(df)
+    for filas in (np.arange(len(df)), motor.filtrar([("categoria", "region", ["Este"])])):
+        ordenadas = motor.ordenar(filas, col, ascendente)
+        assert sorted(ordenadas) == sorted(filas)
+        valores = df[col].iloc[ordenadas].dropna().tolist()
+        assert valores == sorted(valores, reverse=not ascendente)
+
+
+@pytest.mark.parametrize("funcion", FUNCIONES_AGREGACION)
+def test_agrupar_como_pandas(df, funcion):
+    motor = MotorConsultas(df)
+    filas = motor.filtrar([("rango", "unidades", (10, 40))])
+    tabla = motor.agrupar(filas, "region", "ventas", funcion)
+    esperado = df.iloc[filas].groupby("region")["ventas"].agg(funcion)
+    assert tabla["region"].tolist() == esperado.index.tolist()
+    np.testing.assert_allclose(tabla[f"{funcion}(ventas)"], esperado.to_numpy())
+
+
+def test_count_ignora_nulos_y_es_entero():
+    df = pd.DataFrame({"g": ["a", "a", "b"], "v": [1.0, np.nan, 2.0]})
+    tabla = MotorConsultas(df).agrupar(np.arange(3), "g", "v", "count")
+    assert tabla["count(v)"].tolist() == [1, 1]
+    assert pd.api.types.is_integer_dtype(tabla["count(v)"])
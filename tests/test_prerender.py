@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+# Secciones con bloques estatico
+SECCIONES = ["🎯 Elementos de Texto", "🎨 Layout y Contenedores", "⚡ Funciones de Control"]
+
+
+# Estructura del área principal: tipo de cada nodo y, si lo tiene, su texto
+def _arbol(nodo):
+    hijos = getattr(nodo, "children", None)
+    if hijos:
+        return (nodo.type, [_arbol(hijos[k]) for k in sorted(hijos)])
+    valor = getattr(nodo, "value", None)
+    return (nodo.type, valor if isinstance(valor, str) else None)
+
+
+# Árboles de dos sesiones seguidas (la segunda reproduce las grabaciones).
+# PRERENDER se lee al importar: se reimportan las secciones con el modo pedido.
+def _sesiones(monkeypatch, modo, seccion):
+    monkeypatch.setenv("ST_APP_PRERENDER", modo)
+    for modulo in [m for m in sys.modules if m == "secciones" or m.startswith("secciones.")]:
+        monkeypatch.delitem(sys.modules, modulo)
+    st.cache_resource.clear()
+    arboles = []
+    for _ in range(2):
+        at = AppTest.from_file(APP, default_timeout=60).run()
+        at.sidebar.selectbox[0].select(seccion).run()
+        assert not at.exception
+        arboles.append(_arbol(at.main))
+    return arboles
+
+
+@pytest.mark.parametrize("seccion", SECCIONES)
+def test_prerender_no_cambia_el_arbol(monkeypatch, seccion):
+    esperado, _ = _sesiones(monkeypatch, "0", seccion)
+    primera, segunda = _sesiones(monkeypatch, "1", seccion)
+    assert primera == esperado
+    assert segunda == esperado
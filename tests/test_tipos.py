@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from datos.tipos import optimizar_tipos
+
+
+def _optimizar(valores):
+    df, _ = optimizar_tipos(pd.DataFrame({"col": valores}))
+    return df["col"]
+
+
+# Versiones y fechas sin año de 4 cifras se quedan como texto
+@pytest.mark.parametrize("valores", [
+    ["1.2.3", "2.10.1"],
+    ["3-1-2", "4-5-6"],
+    ["31/01/24", "01/02/24"],
+])
+def test_no_son_fechas(valores):
+    col = _optimizar(valores)
+    assert not pd.api.types.is_datetime64_any_dtype(col)
+    assert col.astype(str).tolist() == valores
+
+
+def test_dia_primero():
+    col = _optimizar(["05/06/2024", "31/12/2024"])
+    assert col.tolist() == [pd.Timestamp(2024, 6, 5), pd.Timestamp(2024, 12, 31)]
+
+
+def test_iso_con_hora_y_nulos():
+    col = _optimizar(["2024-01-31 10:30:00", None, "2024-02-01 00:00:00"])
+    assert pd.api.types.is_datetime64_any_dtype(col)
+    assert col[0] == pd.Timestamp(2024, 1, 31, 10, 30)
+    assert pd.isna(col[1])
+
+
+# Un formato solo vale si parsea la columna entera
+def test_formatos_mezclados_quedan_como_texto():
+    valores = ["2024-01-31", "31/01/2024"]
+    col = _optimizar(valores)
+    assert not pd.api.types.is_datetime64_any_dtype(col)
+
+
+def test_mes_primero_no_se_adivina():
+    valores = ["12/31/2024", "01/15/2024"]
+    col = _optimizar(valores)
+    assert not pd.api.types.is_datetime64_any_dtype(col)
@@ -0,0 +1 @@
+# Trabajo fuera del hilo del script: tareas en segundo plano y cola de trabajos
@@ -0,0 +1,240 @@
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import contextlib
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from datos import columnar
+
+# Base SQLite con el estado y los resultados de los trabajos
+RUTA_DB = os.environ.get(
+    "ST_APP_TRABAJOS_DB",
+    os.path.join(os.path.expanduser("~"), ".cache", "st-app", "trabajos.sqlite3")
+)
+MAX_PROCESOS = 2
+# Trabajos pendientes o en ejecución admitidos a la vez
+MAX_EN_COLA = 32
+ESTADOS_ACTIVOS = ("pendiente", "ejecutando")
+# Retención de los trabajos terminados (y sus resultados): antigüedad máxima y
+# número máximo de filas que se conservan
+RETENCION_SEGUNDOS = 7 * 24 * 3600
+MAX_TERMINADOS = 500
+
+
+class ColaLlena(Exception):
+    pass
+
+
+# Conexión corta: confirma la transacción al salir y se cierra.
+# WAL permite que los workers escriban mientras la UI lee.
+@contextlib.contextmanager
+def _conectar(ruta=RUTA_DB):
+    conexion = sqlite3.connect(ruta, timeout=30)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.row_factory = sqlite3.Row
+    try:
+        with conexion:
+            yield conexion
+    finally:
+        conexion.close()
+
+
+def _crear_tabla(ruta):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with _conectar(ruta) as conexion:
+        conexion.execute("""
+            CREATE TABLE IF NOT EXISTS trabajos (
+                id TEXT PRIMARY KEY,
+                tipo TEXT NOT NULL,
+                descripcion TEXT,
+                estado TEXT NOT NULL,
+                creado REAL NOT NULL,
+                iniciado REAL,
+                terminado REAL,
+                resultado BLOB,
+                error TEXT
+            )
+        """)
+
+
+# Funciones de trabajo: reciben el DataFrame de entrada y los parámetros y
+# devuelven un DataFrame. Se ejecutan en procesos worker.
+def _agrupar(df, por, columna, funcion):
+    return df.groupby(por)[columna].agg(funcion).reset_index()
+
+
+def _describir(df):
+    resumen = df.describe(include="all")
+    # Las columnas de texto mezclan conteos y valores: a string para Arrow
+    texto = {c: "string" for c in resumen.columns if resumen[c].dtype == object}
+    return resumen.astype(texto).reset_index()
+
+
+TIPOS = {
+    "agrupar": _agrupar,
+    "describir": _describir,
+}
+
+
+def _a_bytes(df):
+    tabla = pa.Table.from_pandas(df, preserve_index=False)
+    buffer = pa.BufferOutputStream()
+    with pa.ipc.new_stream(buffer, tabla.schema) as writer:
+        writer.write_table(tabla)
+    return buffer.getvalue().to_pybytes()
+
+
+# Cuerpo del proceso worker: lee la entrada, ejecuta y guarda el resultado
+# directamente en SQLite, así el estado no depende de la sesión que lo envió
+def _ejecutar(ruta, id_trabajo, tipo, entrada, parametros):
+    with _conectar(ruta) as conexion:
+        conexion.execute(
+            "UPDATE trabajos SET estado = 'ejecutando', iniciado = ? WHERE id = ?",
+            (time.time(), id_trabajo)
+        )
+    try:
+        if "clave" in entrada:
+            df = columnar.cargar(entrada["clave"])
+            if df is None:
+                raise LookupError("El dataset ya no está en la caché")
+        else:
+            df = pd.read_csv(io.BytesIO(entrada["csv"]))
+        resultado = _a_bytes(TIPOS[tipo](df, **parametros))
+        campos = ("completado", resultado, None)
+    except Exception as e:
+        campos = ("error", None, f"{type(e).__name__}: {e}")
+    with _conectar(ruta) as conexion:
+        conexion.execute(
+            "UPDATE trabajos SET estado = ?, resultado = ?, error = ?, terminado = ? WHERE id = ?",
+            (*campos, time.time(), id_trabajo)
+        )
+
+
+# Callback del futuro: si el worker murió (p. ej. sin memoria con un CSV grande)
+# _ejecutar no llega a guardar nada y el trabajo se marca aquí como fallido
+def _al_terminar(ruta, id_trabajo, futuro):
+    if futuro.cancelled():
+        error = "Cancelado"
+    elif isinstance(futuro.exception(), BrokenProcessPool):
+        error = "El proceso worker terminó de forma inesperada (¿sin memoria?)"
+    elif futuro.exception() is not None:
+        e = futuro.exception()
+        error = f"{type(e).__name__}: {e}"
+    else:
+        return
+    with _conectar(ruta) as conexion:
+        conexion.execute(
+            "UPDATE trabajos SET estado = 'error', error = ?, terminado = ? "
+            f"WHERE id = ? AND estado IN {ESTADOS_ACTIVOS}",
+            (error, time.time(), id_trabajo)
+        )
+
+
+# Borra los trabajos terminados más antiguos que RETENCION_SEGUNDOS y, de los
+# restantes, los que pasen de MAX_TERMINADOS (los más viejos primero)
+def _podar(conexion):
+    conexion.execute(
+        f"DELETE FROM trabajos WHERE estado NOT IN {ESTADOS_ACTIVOS} AND terminado < ?",
+        (time.time() - RETENCION_SEGUNDOS,)
+    )
+    conexion.execute(f"""
+        DELETE FROM trabajos WHERE id IN (
+            SELECT id FROM trabajos WHERE estado NOT IN {ESTADOS_ACTIVOS}
+            ORDER BY terminado DESC LIMIT -1 OFFSET ?
+        )
+    """, (MAX_TERMINADOS,))
+
+
+# Pool y base inicializados una vez por proceso. Los trabajos que quedaron a
+# medias por un reinicio del servidor se marcan como interrumpidos y los
+# terminados se podan según la retención.
+@st.cache_resource
+def obtener_pool():
+    _crear_tabla(RUTA_DB)
+    with _conectar() as conexion:
+        conexion.execute(
+            "UPDATE trabajos SET estado = 'error', error = 'Interrumpido por reinicio', terminado = ? "
+            f"WHERE estado IN {ESTADOS_ACTIVOS}",
+            (time.time(),)
+        )
+        _podar(conexion)
+    # fork por el mismo motivo que en datos/multiples.py
+    metodo = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=MAX_PROCESOS, mp_context=multiprocessing.get_context(metodo))
+
+
+# Encola un trabajo y devuelve su id. El id depende del tipo, la entrada y los
+# parámetros: el mismo trabajo ya completado (o en curso) no se repite.
+def enviar(tipo, entrada, descripcion, **parametros):
+    pool = obtener_pool()
+    huella = hashlib.blake2b(digest_size=8)
+    huella.update(tipo.encode())
+    huella.update(entrada["clave"].encode() if "clave" in entrada else entrada["csv"])
+    huella.update(json.dumps(parametros, sort_keys=True, default=str).encode())
+    id_trabajo = huella.hexdigest()
+
+    with _conectar() as conexion:
+        fila = conexion.execute("SELECT estado FROM trabajos WHERE id = ?", (id_trabajo,)).fetchone()
+        if fila is not None and fila["estado"] != "error":
+            return id_trabajo
+        activos = conexion.execute(
+            f"SELECT COUNT(*) FROM trabajos WHERE estado IN {ESTADOS_ACTIVOS}"
+        ).fetchone()[0]
+        if activos >= MAX_EN_COLA:
+            raise ColaLlena(f"Hay {activos} trabajos en cola; inténtalo más tarde")
+        conexion.execute(
+            "INSERT OR REPLACE INTO trabajos (id, tipo, descripcion, estado, creado) VALUES (?, ?, ?, 'pendiente', ?)",
+            (id_trabajo, tipo, descripcion, time.time())
+        )
+    try:
+        _lanzar(pool, id_trabajo, tipo, entrada, parametros)
+    except BrokenProcessPool:
+        # Un worker murió y el pool quedó inservible: se descarta (al crear el
+        # nuevo, los trabajos del anterior se marcan como interrumpidos) y se
+        # reintenta una vez
+        obtener_pool.clear()
+        pool = obtener_pool()
+        with _conectar() as conexion:
+            conexion.execute(
+                "UPDATE trabajos SET estado = 'pendiente', error = NULL, terminado = NULL WHERE id = ?",
+                (id_trabajo,)
+            )
+        _lanzar(pool, id_trabajo, tipo, entrada, parametros)
+    return id_trabajo
+
+
+def _lanzar(pool, id_trabajo, tipo, entrada, parametros):
+    futuro = pool.submit(_ejecutar, RUTA_DB, id_trabajo, tipo, entrada, parametros)
+    futuro.add_done_callback(functools.partial(_al_terminar, RUTA_DB, id_trabajo))
+
+
+# Últimos trabajos, sin los resultados
+def listar(ids=None, limite=20):
+    obtener_pool()
+    consulta = "SELECT id, tipo, descripcion, estado, creado, iniciado, terminado, error FROM trabajos"
+    argumentos = ()
+    if ids is not None:
+        if not ids:
+            return []
+        consulta += f" WHERE id IN ({', '.join('?' * len(ids))})"
+        argumentos = tuple(ids)
+    consulta += " ORDER BY creado DESC LIMIT ?"
+    with _conectar() as conexion:
+        return [dict(fila) for fila in conexion.execute(consulta, (*argumentos, limite))]
+
+
+def resultado(id_trabajo):
+    with _conectar() as conexion:
+        fila = conexion.execute("SELECT resultado FROM trabajos WHERE id = ?", (id_trabajo,)).fetchone()
+    if fila is None or fila["resultado"] is None:
+        return None
+    return pa.ipc.open_stream(fila["resultado"]).read_all().to_pandas()
@@ -0,0 +1,88 @@
+import streamlit as st
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Hilos compartidos por todas las sesiones para el trabajo largo
+MAX_HILOS = 8
+# Cada cuánto se refresca el fragmento que muestra el progreso
+INTERVALO_REFRESCO = 0.2
+
+
+# Estado de una tarea en segundo plano. El hilo worker solo actualiza este
+# objeto; la UI lo lee desde un fragmento que se re-ejecuta periódicamente.
+class TareaFondo:
+    def __init__(self):
+        self.id = uuid.uuid4().hex[:8]
+        self.progreso = 0
+        self.mensaje = ""
+        self.estado = "pendiente"
+        self.resultado = None
+        self.error = None
+        self.inicio = time.time()
+        self.fin = None
+        self._lock = threading.Lock()
+
+    def reportar(self, progreso, mensaje=""):
+        with self._lock:
+            self.progreso = max(0, min(100, int(progreso)))
+            self.mensaje = mensaje
+
+    @property
+    def terminada(self):
+        return self.estado in ("completada", "error")
+
+
+@st.cache_resource
+def obtener_executor():
+    return ThreadPoolExecutor(max_workers=MAX_HILOS, thread_name_prefix="tarea-fondo")
+
+
+# Ejecuta funcion(tarea.reportar, *args) en un hilo y devuelve la tarea.
+# La función no debe llamar a st.*: no tiene contexto de script.
+def lanzar(funcion, *args, **kwargs):
+    tarea = TareaFondo()
+
+    def ejecutar():
+        tarea.estado = "ejecutando"
+        try:
+            tarea.resultado = funcion(tarea.reportar, *args, **kwargs)
+            tarea.progreso = 100
+            tarea.estado = "completada"
+        except Exception as e:
+            tarea.error = f"{type(e).__name__}: {e}"
+            tarea.estado = "error"
+        finally:
+            tarea.fin = time.time()
+
+    obtener_executor().submit(ejecutar)
+    return tarea
+
+
+# Muestra el progreso de la tarea guardada en st.session_state[clave] dentro
+# de un fragmento: solo ese bloque se re-ejecuta mientras la tarea corre y el
+# resto de la página sigue respondiendo. Al terminar se hace un rerun completo
+# para detener el refresco. Con barra=False se muestra solo el mensaje.
+def mostrar_progreso(clave, al_terminar, barra=True):
+    tarea = st.session_state.get(clave)
+    activa = tarea is not None and not tarea.terminada
+
+    @st.fragment(run_every=INTERVALO_REFRESCO if activa else None)
+    def fragmento():
+        tarea = st.session_state.get(clave)
+        if tarea is None:
+            return
+        if not tarea.terminada:
+            if barra:
+                st.progress(tarea.progreso, text=tarea.mensaje or None)
+            else:
+                st.info(f"⏳ {tarea.mensaje}")
+        elif activa:
+            st.rerun(scope="app")
+        elif tarea.error:
+            st.error(f"Error en la tarea: {tarea.error}")
+        else:
+            al_terminar(tarea)
+
+    fragmento()